@@ -24,7 +24,7 @@ setup(
         "pynput>=1.7.6",
         "rich>=13.0.0",
         "tqdm>=4.66.0",
-        "streamlit>=1.29.0",
+        "streamlit>=1.37.0",
     ],
     entry_points={
         "console_scripts": [
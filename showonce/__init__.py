@@ -14,10 +14,26 @@ __version__ = "0.1.0"
 __author__ = "Venkata Sai"
 __description__ = "AI-powered tool that learns automation workflows from screenshots"
 
-# Package-level imports for convenience
-from showonce.models.workflow import Workflow, WorkflowStep
-from showonce.models.actions import Action, ActionType, ElementTarget
-from showonce.config import Config
+# Package-level names for convenience, imported on first access so that
+# importing one subpackage doesn't load the models and config as well
+_LAZY_IMPORTS = {
+    "Workflow": "showonce.models.workflow",
+    "WorkflowStep": "showonce.models.workflow",
+    "Action": "showonce.models.actions",
+    "ActionType": "showonce.models.actions",
+    "ElementTarget": "showonce.models.actions",
+    "Config": "showonce.config",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     # Version info
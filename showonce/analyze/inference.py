@@ -43,15 +43,16 @@ class ActionInferenceEngine:
         )
         
         pairs = workflow.get_screenshot_pairs()
+        total = workflow.transition_count
         successful_parses = 0
         failed_parses = 0
         action_counter = 1
         
         for i, (before_step, after_step) in enumerate(pairs):
             if progress_callback:
-                progress_callback(i + 1, len(pairs))
+                progress_callback(i + 1, total)
             
-            log.info(f"Analyzing transition {i+1}/{len(pairs)}: Step {before_step.step_number} -> {after_step.step_number}")
+            log.info(f"Analyzing transition {i+1}/{total}: Step {before_step.step_number} -> {after_step.step_number}")
             
             try:
                 actions = self.analyze_transition(
@@ -76,9 +77,10 @@ class ActionInferenceEngine:
                 else:
                     failed_parses += 1
                     log.warning(f"Transition {i+1}: No valid actions parsed")
-                    # Still add a fallback so the sequence isn't broken
-                    fallback = Action(
-                        action_type=ActionType.UNKNOWN,
+                    # Still add a fallback so the sequence isn't broken.
+                    # Fallbacks are built from trusted values, so skip validation.
+                    fallback = Action.model_construct(
+                        action_type=ActionType.UNKNOWN.value,
                         sequence=action_counter,
                         description=after_step.description or f"Step {after_step.step_number}",
                         confidence=0.0
@@ -89,8 +91,8 @@ class ActionInferenceEngine:
             except Exception as e:
                 failed_parses += 1
                 log.error(f"Transition {i+1} failed: {e}")
-                fallback = Action(
-                    action_type=ActionType.UNKNOWN,
+                fallback = Action.model_construct(
+                    action_type=ActionType.UNKNOWN.value,
                     sequence=action_counter,
                     description=after_step.description or f"Step {after_step.step_number}",
                     confidence=0.0
@@ -99,7 +101,6 @@ class ActionInferenceEngine:
                 action_counter += 1
         
         # Accurate reporting
-        total = len(pairs)
         if total > 0:
             if failed_parses == total:
                 log.error(f"❌ Analysis FAILED: All {total} transitions failed to parse")
@@ -128,8 +129,8 @@ class ActionInferenceEngine:
         
         if not before_image or not after_image:
             log.warning("Missing screenshot data for transition")
-            return [Action(
-                action_type=ActionType.UNKNOWN,
+            return [Action.model_construct(
+                action_type=ActionType.UNKNOWN.value,
                 sequence=sequence_start,
                 description=after_step.description or "Unknown action",
                 confidence=0.0,
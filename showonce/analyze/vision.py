@@ -172,6 +172,11 @@ class ClaudeVision:
             b64_data = ""
             
             if isinstance(image, bytes):
+                # Detect type from magic bytes; uploads may be JPEG or WebP
+                if image[:3] == b"\xff\xd8\xff":
+                    media_type = "image/jpeg"
+                elif image[:4] == b"RIFF" and image[8:12] == b"WEBP":
+                    media_type = "image/webp"
                 b64_data = base64.b64encode(image).decode("utf-8")
             elif isinstance(image, (str, Path)):
                 path = Path(image)
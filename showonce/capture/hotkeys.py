@@ -75,7 +75,7 @@ class HotkeyListener:
             # Wrap callback to run in thread to avoid blocking listener
             def safe_callback():
                 try:
-                    log.debug(f"Hotkey triggered: {hotkey}")
+                    log.debug("Hotkey triggered: %s", hotkey)
                     callback()
                 except Exception as e:
                     log.error(f"Error in hotkey callback for {hotkey}: {e}")
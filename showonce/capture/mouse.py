@@ -59,7 +59,7 @@ class MouseListener:
         if pressed and self.on_click_callback:
             try:
                 # We normalize the button name if possible or just pass the event
-                log.debug(f"Mouse click detected at ({x}, {y}) with {button}")
+                log.debug("Mouse click detected at (%s, %s) with %s", x, y, button)
                 self.on_click_callback(x, y, pressed)
             except Exception as e:
                 log.error(f"Error in mouse click callback: {e}")
@@ -1,5 +1,6 @@
 """Recording session manager for ShowOnce."""
 
+import io
 import time
 import threading
 from pathlib import Path
@@ -47,7 +48,8 @@ class RecordingSession:
         self.is_recording = False
         self._stop_event = threading.Event()
         self._capture_requested = threading.Event()
-        self.last_screenshot: Optional[bytes] = None
+        self._capture_done = threading.Event()
+        self.last_screenshot_bytes: Optional[bytes] = None  # Small JPEG preview
         
         log.debug(f"Initialized RecordingSession for '{workflow_name}' (auto_capture={auto_capture})")
     
@@ -137,12 +139,14 @@ class RecordingSession:
                 platform=meta.platform
             )
             
-            self.last_screenshot = image_bytes
+            self.last_screenshot_bytes = self._make_preview(image)
             self._display_status()
             
         except Exception as e:
             log.error(f"Failed to capture step: {e}")
             self.console.print(f"[bold red]Error capturing step: {e}[/bold red]")
+        finally:
+            self._capture_done.set()
     
     def stop(self) -> None:
         """Stop the recording session."""
@@ -160,10 +164,13 @@ class RecordingSession:
         self.console.print("\n[bold yellow]Recording stopped.[/bold yellow]")
         self.console.print(f"Captured {self.workflow.step_count} steps.")
         
-        if self.workflow.step_count > 0:
-            self.save()
-        else:
-            self.console.print("[dim]No steps captured, skipping save.[/dim]")
+        try:
+            if self.workflow.step_count > 0:
+                self.save()
+            else:
+                self.console.print("[dim]No steps captured, skipping save.[/dim]")
+        finally:
+            self._capture_done.set()
     
     def save(self) -> Path:
         """Save the workflow to disk."""
@@ -181,7 +188,22 @@ class RecordingSession:
     
     def request_capture(self) -> None:
         """Manually request a capture (used by UI)."""
+        self._capture_done.clear()
         self._capture_requested.set()
+    
+    def wait_for_capture(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the pending capture (or the final save) has finished.
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if the capture finished, False on timeout
+        """
+        done = self._capture_done.wait(timeout)
+        self._capture_done.clear()
+        return done
         
     def _on_capture_hotkey(self) -> None:
         """Callback for capture hotkey."""
@@ -203,7 +225,7 @@ class RecordingSession:
         if "Streamlit" in title or "ShowOnce" in title:
             return
             
-        log.debug(f"Auto-capturing step on click at ({x}, {y})")
+        log.debug("Auto-capturing step on click at (%s, %s)", x, y)
         # Trigger capture in a way that doesn't block the mouse listener thread
         self.request_capture()
     
@@ -217,6 +239,18 @@ class RecordingSession:
         description = Prompt.ask("What did you just do?", console=self.console)
         return description
     
+    @staticmethod
+    def _make_preview(image, max_edge: int = 960) -> Optional[bytes]:
+        """Shrink a captured frame to a small JPEG for live previews."""
+        try:
+            image.thumbnail((max_edge, max_edge))
+            with io.BytesIO() as buf:
+                image.convert("RGB").save(buf, format="JPEG", quality=80)
+                return buf.getvalue()
+        except Exception as e:
+            log.debug(f"Could not build screenshot preview: {e}")
+            return None
+    
     def _display_status(self) -> None:
         """Display current recording status."""
         self.console.print(f"[dim]Total steps: {self.workflow.step_count}[/dim]")
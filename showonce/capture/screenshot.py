@@ -46,7 +46,7 @@ class ScreenCapture:
                 # Monitor 0 is the "All in One" monitor
                 monitor = sct.monitors[0]
                 sct_img = sct.grab(monitor)
-                log.debug(f"Captured full screen: {sct_img.width}x{sct_img.height}")
+                log.debug("Captured full screen: %sx%s", sct_img.width, sct_img.height)
                 return self._to_image(sct_img)
         except Exception as e:
             log.error(f"Failed to capture full screen: {str(e)}")
@@ -72,7 +72,7 @@ class ScreenCapture:
                 
                 mon_dict = sct.monitors[monitor]
                 sct_img = sct.grab(mon_dict)
-                log.debug(f"Captured monitor {monitor}: {sct_img.width}x{sct_img.height}")
+                log.debug("Captured monitor %s: %sx%s", monitor, sct_img.width, sct_img.height)
                 return self._to_image(sct_img)
         except Exception as e:
             log.error(f"Failed to capture monitor {monitor}: {str(e)}")
@@ -40,7 +40,7 @@ def main(debug: bool):
     Show me once. I'll do it forever.
     """
     level = "DEBUG" if debug else "INFO"
-    setup_logging(level=level)
+    setup_logging(level=level, show_locals=debug)
 
 
 @main.command()
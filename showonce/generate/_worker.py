@@ -0,0 +1,114 @@
+"""
+Persistent script worker for ShowOnce.
+
+Used by ScriptRunner.run_many to execute many generated scripts in a single
+Python process. Reads one JSON job per line on stdin and writes one JSON
+result per line on stdout:
+
+    job:    {"path": "...", "env": {"SHOWONCE_USER": "..."}}
+    result: {"return_code": 0, "output": "...", "error": "..."}
+
+This module deliberately imports nothing from showonce so the worker starts
+as fast as a bare interpreter.
+"""
+
+import io
+import json
+import os
+import sys
+import threading
+import traceback
+from contextlib import redirect_stdout, redirect_stderr
+from types import CodeType
+from typing import Dict, Tuple
+
+
+# Compiled scripts keyed by (path, mtime_ns), so reruns skip recompilation
+_CODE_CACHE: Dict[Tuple[str, int], CodeType] = {}
+
+# run_job swaps process-wide state (environment, std streams, argv), so
+# only one job may run at a time per process
+_RUN_LOCK = threading.Lock()
+
+
+def compile_script(path: str) -> CodeType:
+    """Compile a script once per on-disk version, stripping docstrings and asserts."""
+    key = (path, os.stat(path).st_mtime_ns)
+    code = _CODE_CACHE.get(key)
+    if code is None:
+        with open(path, "r", encoding="utf-8") as f:
+            code = compile(f.read(), path, "exec", optimize=2)
+        _CODE_CACHE[key] = code
+    return code
+
+
+def run_job(job: dict) -> dict:
+    """
+    Execute one script as ``__main__`` and collect its output.
+    
+    Jobs are serialized by a lock. While one runs, other threads in the
+    process still see the environment (plus the job's variables), but
+    their stdout/stderr writes land in the job's captured output.
+    """
+    path = job["path"]
+    out, err = io.StringIO(), io.StringIO()
+    return_code = 0
+    
+    with _RUN_LOCK:
+        saved_env = os.environ.copy()
+        saved_argv, saved_stdin, saved_path0 = sys.argv, sys.stdin, sys.path[0]
+        try:
+            os.environ.update(job.get("env") or {})
+            sys.argv = [path]
+            sys.stdin = io.StringIO()  # Scripts must not consume the job stream
+            sys.path[0] = os.path.dirname(os.path.abspath(path))
+            
+            with redirect_stdout(out), redirect_stderr(err):
+                try:
+                    exec(compile_script(path), {"__name__": "__main__", "__file__": path})
+                except SystemExit as e:
+                    if e.code is None:
+                        return_code = 0
+                    elif isinstance(e.code, int):
+                        return_code = e.code
+                    else:
+                        print(e.code, file=sys.stderr)
+                        return_code = 1
+                except Exception:
+                    traceback.print_exc()
+                    return_code = 1
+        finally:
+            # Undo only what changed, so the environment is never empty
+            for key in os.environ.keys() - saved_env.keys():
+                del os.environ[key]
+            for key, value in saved_env.items():
+                if os.environ.get(key) != value:
+                    os.environ[key] = value
+            sys.argv, sys.stdin, sys.path[0] = saved_argv, saved_stdin, saved_path0
+    
+    return {
+        "return_code": return_code,
+        "output": out.getvalue(),
+        "error": err.getvalue(),
+    }
+
+
+def main() -> None:
+    """Serve jobs from stdin until it is closed."""
+    jobs = sys.stdin
+
+    # Keep the protocol on a private copy of fd 1 and point fd 1 at stderr,
+    # so stray low-level writes from scripts cannot corrupt the result stream
+    protocol = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+
+    for line in jobs:
+        if not line.strip():
+            continue
+        result = run_job(json.loads(line))
+        protocol.write(json.dumps(result) + "\n")
+        protocol.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 """PyAutoGUI code generator for ShowOnce."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pathlib import Path
 from datetime import datetime
+from string import Template
+from itertools import chain
 import re
 
 from showonce.models.actions import ActionSequence, Action, ActionType
@@ -10,6 +12,74 @@ from showonce.config import get_config
 from showonce.utils.logger import log
 
 
+# Characters not allowed in generated identifiers and file names
+_NON_ALNUM = re.compile(r'[^a-zA-Z0-9]')
+
+# Single-pass escaping for values embedded in double-quoted string literals
+_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+# One-line actions, rendered with str.format by _generate_simple
+_SIMPLE_ACTIONS = {
+    ActionType.CLICK: "pyautogui.click({coords})",
+    ActionType.DOUBLE_CLICK: "pyautogui.doubleClick({coords})",
+    ActionType.RIGHT_CLICK: "pyautogui.rightClick({coords})",
+    ActionType.HOVER: "pyautogui.moveTo({coords})",
+    ActionType.PRESS_KEY: "pyautogui.press('{key}')",
+}
+
+# Image-matching fallback options for simple actions without coordinates
+_IMAGE_CLICK_FALLBACK = {
+    ActionType.CLICK: {},
+    ActionType.DOUBLE_CLICK: {"clicks": 2},
+    ActionType.RIGHT_CLICK: {"button": "right"},
+}
+
+# Script skeleton, compiled once and filled in per generate() call
+_HEADER_TMPL = Template('''# Auto-generated by ShowOnce
+# Workflow: ${workflow_name}
+# Generated: ${generated_at}
+# Actions: ${action_count}
+# Framework: PyAutoGUI (Desktop Automation)
+
+import time
+import pyautogui
+
+# Safety settings
+pyautogui.FAILSAFE = ${failsafe}  # Move mouse to corner to abort
+pyautogui.PAUSE = ${pause}  # Pause between actions
+
+
+def ${func_name}(${params}):
+    """
+    Automated workflow: ${workflow_name}
+    
+    Note: This script uses screen coordinates and image matching.
+    Ensure your screen resolution and window positions match recording.
+    
+    Parameters:
+${param_docs}
+    """
+    print("Starting automation in 3 seconds...")
+    print("Move mouse to top-left corner to abort (FAILSAFE)")
+    time.sleep(3)
+    
+''')
+
+_FOOTER_TMPL = Template('''
+    print("Workflow completed!")
+
+
+if __name__ == "__main__":
+${param_input}
+    try:
+        ${func_name}(${call_args})
+    except pyautogui.FailSafeException:
+        print("\\nAutomation aborted by user (failsafe triggered)")
+    except Exception as e:
+        print(f"Error: {e}")
+''')
+
+
 class PyAutoGUIGenerator:
     """Generate PyAutoGUI automation scripts from ActionSequence."""
     
@@ -26,6 +96,9 @@ class PyAutoGUIGenerator:
         self.config = get_config()
         self.indent = "    "  # 4 spaces
         
+        # Partially filled header templates, reused across generate() calls
+        self._header_cache: Dict[tuple, Template] = {}
+        
         log.debug(f"PyAutoGUIGenerator initialized (failsafe={failsafe}, pause={pause})")
     
     def generate(self, action_sequence: ActionSequence) -> str:
@@ -40,8 +113,13 @@ class PyAutoGUIGenerator:
         """
         lines = []
         
+        # Resolve parameter names and descriptions once for header and footer
+        parameters = action_sequence.parameters
+        param_names = [p.get("name", "param") for p in parameters]
+        param_descs = [p.get("description", "parameter") for p in parameters]
+        
         # Header with imports and function definition
-        lines.append(self._generate_header(action_sequence))
+        lines.append(self._generate_header(action_sequence, param_names, param_descs))
         
         # Generate each action
         for action in action_sequence.actions:
@@ -51,28 +129,26 @@ class PyAutoGUIGenerator:
             lines.append("")  # Blank line between actions
         
         # Footer with main block
-        lines.append(self._generate_footer(action_sequence))
+        lines.append(self._generate_footer(action_sequence, param_names))
         
         return "\n".join(lines)
     
     def generate_action(self, action: Action) -> List[str]:
         """Generate code lines for a single action."""
         handlers = {
-            ActionType.CLICK: self._generate_click,
-            ActionType.DOUBLE_CLICK: self._generate_double_click,
-            ActionType.RIGHT_CLICK: self._generate_right_click,
             ActionType.TYPE: self._generate_type,
             ActionType.NAVIGATE: self._generate_navigate,
             ActionType.WAIT: self._generate_wait,
             ActionType.SCROLL_DOWN: self._generate_scroll,
             ActionType.SCROLL_UP: self._generate_scroll,
-            ActionType.PRESS_KEY: self._generate_press_key,
             ActionType.HOTKEY: self._generate_hotkey,
-            ActionType.HOVER: self._generate_hover,
             ActionType.DRAG: self._generate_drag,
         }
         
-        handler = handlers.get(action.action_type, self._generate_unknown)
+        if action.action_type in _SIMPLE_ACTIONS:
+            handler = self._generate_simple
+        else:
+            handler = handlers.get(action.action_type, self._generate_unknown)
         
         # Add comment with step description
         lines = [f"# Step {action.sequence}: {action.to_description()}"]
@@ -80,33 +156,27 @@ class PyAutoGUIGenerator:
         
         return lines
     
-    def _generate_click(self, action: Action) -> List[str]:
-        """Generate click action code."""
+    def _generate_simple(self, action: Action) -> List[str]:
+        """Generate click, double/right click, hover and key press code."""
+        template = _SIMPLE_ACTIONS[action.action_type]
+        
+        if action.action_type == ActionType.PRESS_KEY:
+            return [template.format(key=(action.key or "enter").lower())]
+        
         coords = self._get_coordinates(action)
         if coords:
-            return [f"pyautogui.click({coords})"]
+            return [template.format(coords=coords)]
+        
+        if action.action_type == ActionType.HOVER:
+            return ["# TODO: Hover needs coordinates"]
         
         # Try image-based location
-        return self._generate_image_click(action)
-    
-    def _generate_double_click(self, action: Action) -> List[str]:
-        """Generate double click action code."""
-        coords = self._get_coordinates(action)
-        if coords:
-            return [f"pyautogui.doubleClick({coords})"]
-        return self._generate_image_click(action, clicks=2)
-    
-    def _generate_right_click(self, action: Action) -> List[str]:
-        """Generate right click action code."""
-        coords = self._get_coordinates(action)
-        if coords:
-            return [f"pyautogui.rightClick({coords})"]
-        return self._generate_image_click(action, button='right')
+        return self._generate_image_click(action, **_IMAGE_CLICK_FALLBACK[action.action_type])
     
     def _generate_image_click(self, action: Action, clicks: int = 1, button: str = 'left') -> List[str]:
         """Generate image-based click with fallback."""
         desc = action.target.description if action.target else "element"
-        safe_desc = re.sub(r'[^a-zA-Z0-9]', '_', desc.lower())[:20]
+        safe_desc = _NON_ALNUM.sub('_', desc.lower())[:20]
         
         return [
             f"# Image-based click for: {desc}",
@@ -161,28 +231,15 @@ class PyAutoGUIGenerator:
         
         return [f"pyautogui.scroll({amount})"]
     
-    def _generate_press_key(self, action: Action) -> List[str]:
-        """Generate key press action code."""
-        key = (action.key or "enter").lower()
-        return [f"pyautogui.press('{key}')"]
-    
     def _generate_hotkey(self, action: Action) -> List[str]:
         """Generate hotkey/keyboard shortcut action code."""
         modifiers = action.modifiers or []
         key = action.key or ""
         
-        all_keys = [m.lower() for m in modifiers] + [key.lower()]
-        keys_str = ", ".join([f"'{k}'" for k in all_keys])
+        keys_str = ", ".join(f"'{k.lower()}'" for k in chain(modifiers, (key,)))
         
         return [f"pyautogui.hotkey({keys_str})"]
     
-    def _generate_hover(self, action: Action) -> List[str]:
-        """Generate hover action code."""
-        coords = self._get_coordinates(action)
-        if coords:
-            return [f"pyautogui.moveTo({coords})"]
-        return ["# TODO: Hover needs coordinates"]
-    
     def _generate_drag(self, action: Action) -> List[str]:
         """Generate drag action code."""
         if action.drag_start and action.drag_end:
@@ -209,88 +266,74 @@ class PyAutoGUIGenerator:
         """Escape special characters in strings."""
         if s is None:
             return ""
-        return s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return s.translate(_ESCAPE_TABLE)
     
-    def _generate_header(self, action_sequence: ActionSequence) -> str:
+    def _generate_header(
+        self,
+        action_sequence: ActionSequence,
+        param_names: List[str],
+        param_descs: List[str]
+    ) -> str:
         """Generate script header with imports and function definition."""
-        func_name = self._to_function_name(action_sequence.workflow_name)
-        
-        # Build parameters from variables
-        params = []
-        param_docs = []
-        
-        for param in action_sequence.parameters:
-            name = param.get("name", "param")
-            params.append(f"{name}: str")
-            param_docs.append(f"        {name}: Value for {param.get('description', 'parameter')}")
+        key = (
+            action_sequence.workflow_name,
+            tuple(param_names),
+            tuple(param_descs),
+            self.failsafe,
+            self.pause,
+        )
         
-        params_str = ", ".join(params) if params else ""
-        param_docs_str = "\n".join(param_docs) if param_docs else "        None"
+        # Everything but the timestamp and action count is fixed per key
+        template = self._header_cache.get(key)
+        if template is None:
+            func_name = self._to_function_name(action_sequence.workflow_name)
+            
+            # Build parameters from variables
+            params_str = ", ".join([f"{name}: str" for name in param_names])
+            param_docs_str = "\n".join([
+                f"        {name}: Value for {desc}"
+                for name, desc in zip(param_names, param_descs)
+            ]) or "        None"
+            
+            # Escape '$' so filled-in values survive the second substitution
+            fixed = {
+                "workflow_name": action_sequence.workflow_name,
+                "failsafe": self.failsafe,
+                "pause": self.pause,
+                "func_name": func_name,
+                "params": params_str,
+                "param_docs": param_docs_str,
+            }
+            template = Template(_HEADER_TMPL.safe_substitute(
+                {name: str(value).replace("$", "$$") for name, value in fixed.items()}
+            ))
+            self._header_cache[key] = template
         
-        header = f'''# Auto-generated by ShowOnce
-# Workflow: {action_sequence.workflow_name}
-# Generated: {datetime.now().isoformat()}
-# Actions: {len(action_sequence.actions)}
-# Framework: PyAutoGUI (Desktop Automation)
-
-import time
-import pyautogui
-
-# Safety settings
-pyautogui.FAILSAFE = {self.failsafe}  # Move mouse to corner to abort
-pyautogui.PAUSE = {self.pause}  # Pause between actions
-
-
-def {func_name}({params_str}):
-    """
-    Automated workflow: {action_sequence.workflow_name}
-    
-    Note: This script uses screen coordinates and image matching.
-    Ensure your screen resolution and window positions match recording.
-    
-    Parameters:
-{param_docs_str}
-    """
-    print("Starting automation in 3 seconds...")
-    print("Move mouse to top-left corner to abort (FAILSAFE)")
-    time.sleep(3)
+        return template.substitute(
+            generated_at=datetime.now().isoformat(),
+            action_count=len(action_sequence.actions),
+        )
     
-'''
-        return header
-    
-    def _generate_footer(self, action_sequence: ActionSequence) -> str:
+    def _generate_footer(self, action_sequence: ActionSequence, param_names: List[str]) -> str:
         """Generate script footer with main block."""
         func_name = self._to_function_name(action_sequence.workflow_name)
         
-        param_input = ""
-        example_str = ""
-        
-        if action_sequence.parameters:
-            param_input = "\n".join([
-                f'    {p.get("name")} = input("Enter {p.get("name")}: ")'
-                for p in action_sequence.parameters
-            ])
-            example_str = ", ".join([p.get("name") for p in action_sequence.parameters])
+        param_input = "\n".join([f'    {name} = input("Enter {name}: ")' for name in param_names])
+        example_str = ", ".join(param_names)
         
-        footer = f'''
-    print("Workflow completed!")
-
-
-if __name__ == "__main__":
-{param_input if param_input else "    pass"}
-    try:
-        {func_name}({example_str})
-    except pyautogui.FailSafeException:
-        print("\\nAutomation aborted by user (failsafe triggered)")
-    except Exception as e:
-        print(f"Error: {{e}}")
-'''
-        return footer
+        return _FOOTER_TMPL.substitute(
+            param_input=param_input or "    pass",
+            func_name=func_name,
+            call_args=example_str,
+        )
     
     def _to_function_name(self, name: str) -> str:
         """Convert workflow name to valid Python function name."""
-        func_name = re.sub(r'[^a-zA-Z0-9]', '_', name.lower())
-        func_name = re.sub(r'_+', '_', func_name).strip('_')
+        func_name = _NON_ALNUM.sub('_', name.lower())
+        # Collapse underscore runs; each pass halves the longest run
+        while '__' in func_name:
+            func_name = func_name.replace('__', '_')
+        func_name = func_name.strip('_')
         if func_name and func_name[0].isdigit():
             func_name = 'workflow_' + func_name
         return func_name or 'run_workflow'
@@ -300,8 +343,8 @@ if __name__ == "__main__":
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(code)
+        # Write LF line endings as generated, without newline translation
+        path.write_text(code, encoding='utf-8', newline='\n')
         
         log.success(f"Generated script saved to: {path}")
         return path
@@ -1,15 +1,25 @@
 """Script runner for ShowOnce."""
 
+import os
 import subprocess
 import sys
 import ast
+import json
 import re
+import importlib.util
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+from showonce.generate._worker import run_job
 from showonce.utils.logger import log
 
 
+# Modules that never need installing (Python 3.10+)
+STDLIB_MODULES = sys.stdlib_module_names
+
+# Worker script that executes many scripts in one interpreter (see run_many)
+WORKER_PATH = Path(__file__).with_name("_worker.py")
+
 class ScriptRunner:
     """Execute generated automation scripts."""
     
@@ -25,6 +35,14 @@ class ScriptRunner:
         if not self.script_path.exists():
             raise FileNotFoundError(f"Script not found: {self.script_path}")
         
+        # Source and parsed AST, loaded lazily and shared by the inspection methods
+        self._source: Optional[str] = None
+        self._tree: Optional[ast.Module] = None
+        self._validation: Optional[tuple[bool, str]] = None
+        
+        # Environment snapshot shared by every run; params are layered on per call
+        self._base_env: Dict[str, str] = os.environ.copy()
+        
         log.debug(f"ScriptRunner initialized for: {self.script_path}")
     
     def run(
@@ -39,7 +57,7 @@ class ScriptRunner:
         Args:
             params: Parameters to pass as environment variables
             timeout: Execution timeout in seconds
-            capture_output: Whether to capture stdout/stderr
+            capture_output: Whether to capture stdout/stderr (discarded otherwise)
             
         Returns:
             {success: bool, output: str, error: str, return_code: int}
@@ -47,20 +65,21 @@ class ScriptRunner:
         log.info(f"Running script: {self.script_path}")
         
         # Build environment with parameters
-        import os
-        env = os.environ.copy()
+        env = self._build_env(params)
         
-        if params:
-            for key, value in params.items():
-                env[f"SHOWONCE_{key.upper()}"] = str(value)
+        if capture_output:
+            streams = {"capture_output": True}
+        else:
+            # Discard output so chatty scripts never block on our terminal
+            streams = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
         
         try:
             result = subprocess.run(
                 [sys.executable, str(self.script_path)],
                 env=env,
                 timeout=timeout,
-                capture_output=capture_output,
-                text=True
+                text=True,
+                **streams
             )
             
             success = result.returncode == 0
@@ -94,6 +113,43 @@ class ScriptRunner:
                 "return_code": -1
             }
     
+    def run_in_process(self, params: Optional[Dict[str, Any]] = None) -> dict:
+        """
+        Execute the script inside the current interpreter.
+        
+        Skips the subprocess spawn entirely, and the compiled code object is
+        cached per file version so repeated runs skip recompilation too. The
+        script runs as ``__main__``; its output is captured and the process
+        environment is restored afterwards.
+        
+        The script shares this process's environment, argv and std streams,
+        so in-process runs are serialized; prefer run() from multi-threaded
+        hosts such as the Streamlit UI, whose other threads would have their
+        output captured while a script runs.
+        
+        Args:
+            params: Parameters to pass as environment variables
+            
+        Returns:
+            {success: bool, output: str, error: str, return_code: int}
+        """
+        log.info(f"Running script in-process: {self.script_path}")
+        
+        result = run_job({"path": str(self.script_path), "env": self._param_env(params)})
+        success = result["return_code"] == 0
+        
+        if success:
+            log.success("Script executed successfully")
+        else:
+            log.error(f"Script failed with code: {result['return_code']}")
+        
+        return {
+            "success": success,
+            "output": result["output"],
+            "error": result["error"],
+            "return_code": result["return_code"]
+        }
+    
     def run_interactive(
         self,
         params: Optional[Dict[str, Any]] = None,
@@ -111,12 +167,7 @@ class ScriptRunner:
         """
         log.info(f"Running script interactively: {self.script_path}")
         
-        import os
-        env = os.environ.copy()
-        
-        if params:
-            for key, value in params.items():
-                env[f"SHOWONCE_{key.upper()}"] = str(value)
+        env = self._build_env(params)
         
         try:
             result = subprocess.run(
@@ -129,6 +180,118 @@ class ScriptRunner:
             log.error(f"Script timed out after {timeout}s")
             return -1
     
+    @classmethod
+    def run_many(
+        cls,
+        scripts: List[Path],
+        params_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+        timeout: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Execute several scripts sequentially in one persistent Python worker.
+        
+        Interpreter startup is paid once for the whole batch instead of once
+        per script. Each script still runs as ``__main__`` in a fresh namespace.
+        
+        Args:
+            scripts: Paths to the Python scripts, executed in order
+            params_list: Optional per-script parameters (same order as scripts)
+            timeout: Execution timeout in seconds for the whole batch
+            
+        Returns:
+            List of {success, output, error, return_code}, one per script
+        """
+        runners = [cls(path) for path in scripts]
+        if params_list is None:
+            params_list = [None] * len(runners)
+        if len(params_list) != len(runners):
+            raise ValueError("params_list must have one entry per script")
+        
+        log.info(f"Running {len(runners)} scripts in a shared worker")
+        
+        jobs = "".join(
+            json.dumps({
+                "path": str(runner.script_path),
+                "env": cls._param_env(params)
+            }) + "\n"
+            for runner, params in zip(runners, params_list)
+        )
+        
+        try:
+            proc = subprocess.run(
+                [sys.executable, str(WORKER_PATH)],
+                input=jobs,
+                timeout=timeout,
+                capture_output=True,
+                text=True
+            )
+            worker_error = proc.stderr
+            replies = [json.loads(line) for line in proc.stdout.splitlines() if line.strip()]
+        except subprocess.TimeoutExpired as e:
+            log.error(f"Script batch timed out after {timeout}s")
+            worker_error = f"Script batch timed out after {timeout} seconds"
+            # Keep the results of scripts that finished before the timeout;
+            # partial output is bytes, and only complete lines are replies
+            partial = e.stdout.decode("utf-8", "replace") if isinstance(e.stdout, bytes) else (e.stdout or "")
+            replies = [json.loads(line) for line in partial.splitlines(keepends=True)
+                       if line.endswith("\n") and line.strip()]
+        except Exception as e:
+            log.error(f"Script batch execution error: {e}")
+            worker_error = str(e)
+            replies = []
+        
+        results = []
+        for i, runner in enumerate(runners):
+            if i < len(replies):
+                reply = replies[i]
+                results.append({
+                    "success": reply["return_code"] == 0,
+                    "output": reply["output"],
+                    "error": reply["error"],
+                    "return_code": reply["return_code"]
+                })
+            else:
+                # Worker stopped before reaching this script
+                results.append({
+                    "success": False,
+                    "output": "",
+                    "error": worker_error or "Worker exited before running script",
+                    "return_code": -1
+                })
+        
+        failed = sum(1 for r in results if not r["success"])
+        if failed:
+            log.error(f"{failed} of {len(results)} scripts failed")
+        else:
+            log.success(f"All {len(results)} scripts executed successfully")
+        
+        return results
+    
+    @staticmethod
+    def _param_env(params: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Map script parameters to SHOWONCE_* environment variables."""
+        if not params:
+            return {}
+        return {f"SHOWONCE_{key.upper()}": str(value) for key, value in params.items()}
+    
+    def _build_env(self, params: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Get the child environment: the base snapshot plus any parameters."""
+        if not params:
+            return self._base_env
+        return {**self._base_env, **self._param_env(params)}
+    
+    def _get_tree(self) -> ast.Module:
+        """Read and parse the script once, reusing the result on later calls."""
+        if self._tree is None:
+            if self._source is None:
+                with open(self.script_path, 'r', encoding='utf-8') as f:
+                    self._source = f.read()
+            # Same as ast.parse, minus its Python-level wrapper
+            self._tree = compile(
+                self._source, str(self.script_path), 'exec', flags=ast.PyCF_ONLY_AST
+            )
+        return self._tree
+    
     def validate_script(self) -> tuple[bool, str]:
         """
         Validate script syntax without running.
@@ -136,24 +299,27 @@ class ScriptRunner:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        # The script is parsed at most once; repeat calls reuse the outcome
+        if self._validation is not None:
+            return self._validation
+        
         try:
-            with open(self.script_path, 'r', encoding='utf-8') as f:
-                source = f.read()
-            
             # Parse the AST to check syntax
-            ast.parse(source)
+            self._get_tree()
             
             log.debug("Script syntax is valid")
-            return (True, "")
+            self._validation = (True, "")
             
         except SyntaxError as e:
             error_msg = f"Syntax error at line {e.lineno}: {e.msg}"
             log.error(error_msg)
-            return (False, error_msg)
+            self._validation = (False, error_msg)
         except Exception as e:
             error_msg = f"Validation error: {str(e)}"
             log.error(error_msg)
             return (False, error_msg)
+        
+        return self._validation
     
     def check_dependencies(self) -> tuple[bool, List[str]]:
         """
@@ -165,14 +331,12 @@ class ScriptRunner:
             Tuple of (all_installed, missing_packages)
         """
         try:
-            with open(self.script_path, 'r', encoding='utf-8') as f:
-                source = f.read()
-            
             # Parse AST to find imports
-            tree = ast.parse(source)
+            tree = self._get_tree()
             imports = set()
             
-            for node in ast.walk(tree):
+            # Generated scripts import at module level, so top-level statements suffice
+            for node in tree.body:
                 if isinstance(node, ast.Import):
                     for alias in node.names:
                         imports.add(alias.name.split('.')[0])
@@ -182,20 +346,15 @@ class ScriptRunner:
             
             # Check each import
             missing = []
-            builtin_modules = {
-                'asyncio', 'time', 'sys', 'os', 'subprocess', 're', 
-                'json', 'datetime', 'pathlib', 'typing', 'webbrowser'
-            }
             
             for module in imports:
-                if module in builtin_modules:
+                if module in STDLIB_MODULES:
                     continue
                 if module == 'showonce':
                     continue
                 
-                try:
-                    __import__(module)
-                except ImportError:
+                # Resolve without importing, so no module side effects run here
+                if importlib.util.find_spec(module) is None:
                     missing.append(module)
             
             if missing:
@@ -217,10 +376,7 @@ class ScriptRunner:
             Dict with name, docstring, parameters
         """
         try:
-            with open(self.script_path, 'r', encoding='utf-8') as f:
-                source = f.read()
-            
-            tree = ast.parse(source)
+            tree = self._get_tree()
             
             info = {
                 "name": self.script_path.stem,
@@ -235,9 +391,9 @@ class ScriptRunner:
                 if isinstance(tree.body[0].value, ast.Constant):
                     info["docstring"] = tree.body[0].value.value
             
-            # Find functions and their parameters
-            for node in ast.walk(tree):
-                if isinstance(node, ast.AsyncFunctionDef) or isinstance(node, ast.FunctionDef):
+            # Find top-level functions and their parameters
+            for node in tree.body:
+                if isinstance(node, (ast.AsyncFunctionDef, ast.FunctionDef)):
                     func_info = {
                         "name": node.name,
                         "parameters": [arg.arg for arg in node.args.args if arg.arg != 'self'],
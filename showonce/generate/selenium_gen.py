@@ -1,8 +1,10 @@
 """Selenium code generator for ShowOnce."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional, TextIO, Union
 from pathlib import Path
 from datetime import datetime
+from string import Template
+import io
 import re
 
 from showonce.models.actions import ActionSequence, Action, ActionType
@@ -10,9 +12,132 @@ from showonce.config import get_config
 from showonce.utils.logger import log
 
 
+# Patterns used to turn workflow names into function names
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+_MULTI_UNDERSCORE_RE = re.compile(r'_+')
+
+# Single-pass escaping for values embedded in double-quoted string literals
+_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+# Fallback locator and page-load wait shared by several handlers
+_BODY_LOCATOR = '(By.TAG_NAME, "body")'
+_BODY_WAIT_LINE = "wait.until(EC.presence_of_element_located((By.TAG_NAME, 'body')))"
+
+# Actions that already wait on their own, so no pause is appended after them
+_NO_SLEEP_AFTER = frozenset({ActionType.WAIT, ActionType.WAIT_FOR_ELEMENT, ActionType.NAVIGATE})
+
+# Script skeleton, compiled once; filled in by _generate_header/_generate_footer
+_HEADER_TMPL = Template('''# Auto-generated by ShowOnce
+# Workflow: ${workflow_name}
+# Generated: ${generated_at}
+# Actions: ${action_count}
+
+import time
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.support.ui import Select
+${import_browser}
+
+
+def _click(driver, wait, locator, mode="click"):
+    """Wait until an element is clickable, then click it according to mode."""
+    element = wait.until(EC.element_to_be_clickable(locator))
+    if mode == "double":
+        ActionChains(driver).double_click(element).perform()
+    elif mode == "right":
+        ActionChains(driver).context_click(element).perform()
+    elif mode == "check":
+        if not element.is_selected():
+            element.click()
+    elif mode == "uncheck":
+        if element.is_selected():
+            element.click()
+    else:
+        element.click()
+    return element
+
+
+def ${func_name}(${params}):
+    """
+    Automated workflow: ${workflow_name}
+    
+    Parameters:
+${param_docs}
+    """
+    options = ${options_class}()
+    ${headless_line}
+    options.add_argument("--start-maximized")
+    
+    ${driver_setup}
+    wait = WebDriverWait(driver, 10)
+    
+    try:
+''')
+
+_FOOTER_TMPL = Template('''
+    except Exception as e:
+        print(f"Error during automation: {e}")
+        raise
+    finally:
+        driver.quit()
+        print("Workflow completed!")
+
+
+if __name__ == "__main__":
+${param_input}
+    ${func_name}(${call_args})
+''')
+
+
 class SeleniumGenerator:
     """Generate Selenium automation scripts from ActionSequence."""
     
+    # Browser-specific (driver_setup, options_class, import_browser) header fragments
+    _BROWSER_SETUP: Dict[str, tuple[str, str, str]] = {
+        "chrome": (
+            "driver = webdriver.Chrome(options=options)",
+            "ChromeOptions",
+            "from selenium.webdriver.chrome.options import Options as ChromeOptions",
+        ),
+        "firefox": (
+            "driver = webdriver.Firefox(options=options)",
+            "FirefoxOptions",
+            "from selenium.webdriver.firefox.options import Options as FirefoxOptions",
+        ),
+        "edge": (
+            "driver = webdriver.Edge(options=options)",
+            "EdgeOptions",
+            "from selenium.webdriver.edge.options import Options as EdgeOptions",
+        ),
+    }
+    
+    # Handler method names by action type, resolved with getattr per action
+    _HANDLERS: Dict[ActionType, str] = {
+        ActionType.CLICK: "_generate_click",
+        ActionType.DOUBLE_CLICK: "_generate_double_click",
+        ActionType.RIGHT_CLICK: "_generate_right_click",
+        ActionType.TYPE: "_generate_type",
+        ActionType.SELECT: "_generate_select",
+        ActionType.NAVIGATE: "_generate_navigate",
+        ActionType.WAIT: "_generate_wait",
+        ActionType.WAIT_FOR_ELEMENT: "_generate_wait_for_element",
+        ActionType.SCROLL_DOWN: "_generate_scroll",
+        ActionType.SCROLL_UP: "_generate_scroll",
+        ActionType.SCROLL_TO: "_generate_scroll",
+        ActionType.PRESS_KEY: "_generate_press_key",
+        ActionType.HOTKEY: "_generate_hotkey",
+        ActionType.HOVER: "_generate_hover",
+        ActionType.CHECK: "_generate_check",
+        ActionType.UNCHECK: "_generate_uncheck",
+        ActionType.REFRESH: "_generate_refresh",
+        ActionType.GO_BACK: "_generate_go_back",
+        ActionType.GO_FORWARD: "_generate_go_forward",
+    }
+    
     def __init__(self, browser: str = "chrome", headless: bool = False):
         """
         Initialize generator with settings.
@@ -25,68 +150,66 @@ class SeleniumGenerator:
         self.headless = headless
         self.config = get_config()
         self.indent = "    "  # 4 spaces
+        self._body_indent = self.indent * 2  # Action code sits inside try: in the function
+        
+        # Browser and headless mode are fixed per instance, so resolve them once
+        self._driver_setup, self._options_class, self._import_browser = self._BROWSER_SETUP.get(
+            self.browser, self._BROWSER_SETUP["chrome"]
+        )
+        self._headless_line = (
+            'options.add_argument("--headless")' if headless
+            else "# options.add_argument('--headless')  # Uncomment for headless mode"
+        )
+        
+        # Locator strings by id(action.target). Only set during generate(), while
+        # the sequence keeps every target alive, so ids cannot be reused.
+        self._locator_cache: Optional[Dict[int, str]] = None
         
         log.debug(f"SeleniumGenerator initialized (browser={browser}, headless={headless})")
     
-    def generate(self, action_sequence: ActionSequence) -> str:
+    def generate(self, action_sequence: ActionSequence, out: Optional[TextIO] = None) -> Optional[str]:
         """
         Generate complete Selenium script.
         
         Args:
             action_sequence: ActionSequence with actions to convert
+            out: Optional text stream to write the script to instead of
+                building it in memory
             
         Returns:
-            Complete Python script as string
+            Complete Python script as string, or None if written to out
         """
-        lines = []
+        buf = io.StringIO() if out is None else out
+        prefix = self._body_indent
         
         # Header with imports and function definition
-        lines.append(self._generate_header(action_sequence))
+        buf.write(self._generate_header(action_sequence))
+        buf.write("\n")
         
-        # Generate each action
-        for action in action_sequence.actions:
-            action_lines = self.generate_action(action)
-            for line in action_lines:
-                lines.append(f"{self.indent * 2}{line}")
-            lines.append("")  # Blank line between actions
+        # Generate each action, each followed by a blank line
+        self._locator_cache = {}
+        try:
+            for action in action_sequence.actions:
+                buf.write("\n".join([prefix + line for line in self.generate_action(action)]))
+                buf.write("\n\n")
+        finally:
+            self._locator_cache = None
         
         # Footer with main block
-        lines.append(self._generate_footer(action_sequence))
+        buf.write(self._generate_footer(action_sequence))
         
-        return "\n".join(lines)
+        return buf.getvalue() if out is None else None
     
     def generate_action(self, action: Action) -> List[str]:
         """Generate code lines for a single action."""
-        handlers = {
-            ActionType.CLICK: self._generate_click,
-            ActionType.DOUBLE_CLICK: self._generate_double_click,
-            ActionType.RIGHT_CLICK: self._generate_right_click,
-            ActionType.TYPE: self._generate_type,
-            ActionType.SELECT: self._generate_select,
-            ActionType.NAVIGATE: self._generate_navigate,
-            ActionType.WAIT: self._generate_wait,
-            ActionType.WAIT_FOR_ELEMENT: self._generate_wait_for_element,
-            ActionType.SCROLL_DOWN: self._generate_scroll,
-            ActionType.SCROLL_UP: self._generate_scroll,
-            ActionType.SCROLL_TO: self._generate_scroll,
-            ActionType.PRESS_KEY: self._generate_press_key,
-            ActionType.HOTKEY: self._generate_hotkey,
-            ActionType.HOVER: self._generate_hover,
-            ActionType.CHECK: self._generate_check,
-            ActionType.UNCHECK: self._generate_uncheck,
-            ActionType.REFRESH: self._generate_refresh,
-            ActionType.GO_BACK: self._generate_go_back,
-            ActionType.GO_FORWARD: self._generate_go_forward,
-        }
-        
-        handler = handlers.get(action.action_type, self._generate_unknown)
+        handler = getattr(self, self._HANDLERS.get(action.action_type, "_generate_unknown"))
         
         # Add comment with step description
         lines = [f"# Step {action.sequence}: {action.to_description()}"]
         lines.extend(handler(action))
         
         # Add a small wait after actions
-        if action.action_type not in [ActionType.WAIT, ActionType.WAIT_FOR_ELEMENT, ActionType.NAVIGATE]:
+        if action.action_type not in _NO_SLEEP_AFTER:
             lines.append("time.sleep(0.3)  # Brief pause")
         
         return lines
@@ -94,26 +217,17 @@ class SeleniumGenerator:
     def _generate_click(self, action: Action) -> List[str]:
         """Generate click action code."""
         locator = self._get_locator(action)
-        return [
-            f"element = wait.until(EC.element_to_be_clickable({locator}))",
-            "element.click()"
-        ]
+        return [f"_click(driver, wait, {locator})"]
     
     def _generate_double_click(self, action: Action) -> List[str]:
         """Generate double click action code."""
         locator = self._get_locator(action)
-        return [
-            f"element = wait.until(EC.element_to_be_clickable({locator}))",
-            "ActionChains(driver).double_click(element).perform()"
-        ]
+        return [f"_click(driver, wait, {locator}, 'double')"]
     
     def _generate_right_click(self, action: Action) -> List[str]:
         """Generate right click action code."""
         locator = self._get_locator(action)
-        return [
-            f"element = wait.until(EC.element_to_be_clickable({locator}))",
-            "ActionChains(driver).context_click(element).perform()"
-        ]
+        return [f"_click(driver, wait, {locator}, 'right')"]
     
     def _generate_type(self, action: Action) -> List[str]:
         """Generate type/fill action code."""
@@ -144,7 +258,7 @@ class SeleniumGenerator:
         url = action.url or ""
         return [
             f'driver.get("{url}")',
-            "wait.until(EC.presence_of_element_located((By.TAG_NAME, 'body')))"
+            _BODY_WAIT_LINE
         ]
     
     def _generate_wait(self, action: Action) -> List[str]:
@@ -182,12 +296,10 @@ class SeleniumGenerator:
         modifiers = action.modifiers or []
         key = action.key or ""
         
-        keys = []
-        for mod in modifiers:
-            keys.append(f"Keys.{mod.upper()}")
-        keys.append(f"'{key}'")
-        
-        chain = ", ".join(keys)
+        if modifiers:
+            chain = ", ".join("Keys." + mod.upper() for mod in modifiers) + f", '{key}'"
+        else:
+            chain = f"'{key}'"
         return [f"ActionChains(driver).key_down({chain}).key_up({chain}).perform()"]
     
     def _generate_hover(self, action: Action) -> List[str]:
@@ -201,20 +313,12 @@ class SeleniumGenerator:
     def _generate_check(self, action: Action) -> List[str]:
         """Generate checkbox check action code."""
         locator = self._get_locator(action)
-        return [
-            f"checkbox = wait.until(EC.element_to_be_clickable({locator}))",
-            "if not checkbox.is_selected():",
-            "    checkbox.click()"
-        ]
+        return [f"_click(driver, wait, {locator}, 'check')"]
     
     def _generate_uncheck(self, action: Action) -> List[str]:
         """Generate checkbox uncheck action code."""
         locator = self._get_locator(action)
-        return [
-            f"checkbox = wait.until(EC.element_to_be_clickable({locator}))",
-            "if checkbox.is_selected():",
-            "    checkbox.click()"
-        ]
+        return [f"_click(driver, wait, {locator}, 'uncheck')"]
     
     def _generate_refresh(self, action: Action) -> List[str]:
         """Generate page refresh action code."""
@@ -235,134 +339,112 @@ class SeleniumGenerator:
     def _get_locator(self, action: Action) -> str:
         """Generate Selenium locator tuple."""
         if not action.target:
-            return '(By.TAG_NAME, "body")'
+            return _BODY_LOCATOR
+        
+        # The same target is often reused by several actions in a workflow
+        cache = self._locator_cache
+        key = id(action.target)
+        if cache is not None and key in cache:
+            return cache[key]
         
         primary = action.target.get_primary_selector()
         if not primary:
             if action.target.text_content:
-                return f'(By.XPATH, "//*[contains(text(), \'{action.target.text_content}\')]")'
-            return '(By.TAG_NAME, "body")'
+                locator = f'(By.XPATH, "//*[contains(text(), \'{action.target.text_content}\')]")'
+            else:
+                locator = _BODY_LOCATOR
+        else:
+            # Convert to Selenium By locator
+            by_type, value = primary.to_selenium()
+            locator = f'({by_type}, "{self._escape_string(value)}")'
         
-        # Convert to Selenium By locator
-        by_type, value = primary.to_selenium()
-        return f'({by_type}, "{self._escape_string(value)}")'
+        if cache is not None:
+            cache[key] = locator
+        return locator
     
     def _escape_string(self, s: str) -> str:
         """Escape special characters in strings."""
         if s is None:
             return ""
-        return s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        if not ("\\" in s or '"' in s or "\n" in s):
+            return s
+        return s.translate(_ESCAPE_TABLE)
     
     def _generate_header(self, action_sequence: ActionSequence) -> str:
         """Generate script header with imports and function definition."""
         func_name = self._to_function_name(action_sequence.workflow_name)
         
         # Build parameters from variables
-        params = []
-        param_docs = []
-        
-        for param in action_sequence.parameters:
-            name = param.get("name", "param")
-            params.append(f"{name}: str")
-            param_docs.append(f"        {name}: Value for {param.get('description', 'parameter')}")
-        
-        params_str = ", ".join(params) if params else ""
-        param_docs_str = "\n".join(param_docs) if param_docs else "        None"
-        
-        # Browser setup
-        if self.browser == "firefox":
-            driver_setup = "driver = webdriver.Firefox(options=options)"
-            options_class = "FirefoxOptions"
-            import_browser = "from selenium.webdriver.firefox.options import Options as FirefoxOptions"
-        elif self.browser == "edge":
-            driver_setup = "driver = webdriver.Edge(options=options)"
-            options_class = "EdgeOptions"
-            import_browser = "from selenium.webdriver.edge.options import Options as EdgeOptions"
+        if not action_sequence.parameters:
+            params_str = ""
+            param_docs_str = "        None"
         else:
-            driver_setup = "driver = webdriver.Chrome(options=options)"
-            options_class = "ChromeOptions"
-            import_browser = "from selenium.webdriver.chrome.options import Options as ChromeOptions"
-        
-        headless_line = 'options.add_argument("--headless")' if self.headless else "# options.add_argument('--headless')  # Uncomment for headless mode"
+            params = []
+            param_docs = []
+            
+            for param in action_sequence.parameters:
+                name = param.get("name", "param")
+                params.append(f"{name}: str")
+                param_docs.append(f"        {name}: Value for {param.get('description', 'parameter')}")
+            
+            params_str = ", ".join(params)
+            param_docs_str = "\n".join(param_docs)
         
-        header = f'''# Auto-generated by ShowOnce
-# Workflow: {action_sequence.workflow_name}
-# Generated: {datetime.now().isoformat()}
-# Actions: {len(action_sequence.actions)}
-
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.support.ui import Select
-{import_browser}
-
-
-def {func_name}({params_str}):
-    """
-    Automated workflow: {action_sequence.workflow_name}
-    
-    Parameters:
-{param_docs_str}
-    """
-    options = {options_class}()
-    {headless_line}
-    options.add_argument("--start-maximized")
-    
-    {driver_setup}
-    wait = WebDriverWait(driver, 10)
-    
-    try:
-'''
-        return header
+        return _HEADER_TMPL.substitute(
+            workflow_name=action_sequence.workflow_name,
+            generated_at=datetime.now().isoformat(),
+            action_count=len(action_sequence.actions),
+            import_browser=self._import_browser,
+            func_name=func_name,
+            params=params_str,
+            param_docs=param_docs_str,
+            options_class=self._options_class,
+            headless_line=self._headless_line,
+            driver_setup=self._driver_setup,
+        )
     
     def _generate_footer(self, action_sequence: ActionSequence) -> str:
         """Generate script footer with main block."""
         func_name = self._to_function_name(action_sequence.workflow_name)
         
-        param_input = ""
-        example_str = ""
+        if not action_sequence.parameters:
+            return _FOOTER_TMPL.substitute(param_input="    pass", func_name=func_name, call_args="")
         
-        if action_sequence.parameters:
-            param_input = "\n".join([
-                f'    {p.get("name")} = input("Enter {p.get("name")}: ")'
-                for p in action_sequence.parameters
-            ])
-            example_str = ", ".join([p.get("name") for p in action_sequence.parameters])
+        param_input = "\n".join([
+            f'    {p.get("name")} = input("Enter {p.get("name")}: ")'
+            for p in action_sequence.parameters
+        ])
+        example_str = ", ".join([p.get("name") for p in action_sequence.parameters])
         
-        footer = f'''
-    except Exception as e:
-        print(f"Error during automation: {{e}}")
-        raise
-    finally:
-        driver.quit()
-        print("Workflow completed!")
-
-
-if __name__ == "__main__":
-{param_input if param_input else "    pass"}
-    {func_name}({example_str})
-'''
-        return footer
+        return _FOOTER_TMPL.substitute(
+            param_input=param_input,
+            func_name=func_name,
+            call_args=example_str,
+        )
     
     def _to_function_name(self, name: str) -> str:
         """Convert workflow name to valid Python function name."""
-        func_name = re.sub(r'[^a-zA-Z0-9]', '_', name.lower())
-        func_name = re.sub(r'_+', '_', func_name).strip('_')
+        func_name = _NON_ALNUM_RE.sub('_', name.lower())
+        func_name = _MULTI_UNDERSCORE_RE.sub('_', func_name).strip('_')
         if func_name and func_name[0].isdigit():
             func_name = 'workflow_' + func_name
         return func_name or 'run_workflow'
     
-    def save(self, code: str, path: Path) -> Path:
-        """Save generated code to file."""
+    def save(self, code: Union[str, ActionSequence], path: Path) -> Path:
+        """
+        Save generated code to file.
+        
+        Passing the ActionSequence itself streams the script straight to
+        disk instead of building the whole string first.
+        """
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(path, 'w', encoding='utf-8') as f:
-            f.write(code)
+            if isinstance(code, ActionSequence):
+                self.generate(code, out=f)
+            else:
+                f.write(code)
         
         log.success(f"Generated script saved to: {path}")
         return path
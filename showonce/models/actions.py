@@ -72,6 +72,18 @@ class SelectorStrategy(str, Enum):
     COORDINATES = "coordinates"
 
 
+# Selenium ``By`` locator strings per strategy. These are the values of the
+# selenium.webdriver.common.by.By constants, spelled out so the models do not
+# require selenium to be installed.
+_SELENIUM_BY_CSS = "css selector"
+_SELENIUM_BY_MAPPING = {
+    SelectorStrategy.CSS: _SELENIUM_BY_CSS,
+    SelectorStrategy.XPATH: "xpath",
+    SelectorStrategy.TEXT: "link text",
+    SelectorStrategy.LABEL: "name",
+}
+
+
 class Selector(BaseModel):
     """A single element selector with its strategy."""
     
@@ -100,15 +112,7 @@ class Selector(BaseModel):
     
     def to_selenium(self) -> tuple[str, str]:
         """Convert to Selenium By locator format."""
-        from selenium.webdriver.common.by import By
-        
-        mapping = {
-            SelectorStrategy.CSS: (By.CSS_SELECTOR, self.value),
-            SelectorStrategy.XPATH: (By.XPATH, self.value),
-            SelectorStrategy.TEXT: (By.LINK_TEXT, self.value),
-            SelectorStrategy.LABEL: (By.NAME, self.value),
-        }
-        return mapping.get(self.strategy, (By.CSS_SELECTOR, self.value))
+        return (_SELENIUM_BY_MAPPING.get(self.strategy, _SELENIUM_BY_CSS), self.value)
 
 
 class ElementTarget(BaseModel):
@@ -4,13 +4,125 @@ Workflow data models.
 Defines the structure for recorded workflows and their steps.
 """
 
+import os
 import json
+import mmap
 import base64
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, field, asdict
-from pydantic import BaseModel, Field
+from itertools import pairwise
+from typing import Optional, List, Dict, Any, Iterator, TextIO
+from pydantic import BaseModel, Field, PrivateAttr
+
+# Use the SIMD-accelerated pybase64 for screenshot encoding when available
+try:
+    import pybase64 as _b64
+    _b64encode, _b64decode = _b64.b64encode, _b64.b64decode
+    _B64_PARALLEL = True  # pybase64 releases the GIL, so threads scale
+except ImportError:
+    _b64encode, _b64decode = base64.b64encode, base64.b64decode
+    _B64_PARALLEL = False
+
+# Hash screenshots with xxh3 when available, to spot repeated frames
+try:
+    import xxhash
+    
+    def _hash_screenshot(data: bytes) -> bytes:
+        return xxhash.xxh3_64_digest(data)
+except ImportError:
+    def _hash_screenshot(data: bytes) -> bytes:
+        return hashlib.blake2b(data, digest_size=8).digest()
+
+# Use orjson for workflow.json when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Screenshot markers used by Workflow.summary
+_YES = "📸"
+_NO = "  "
+
+
+def _dump_json(data: Any, pretty: bool = False) -> bytes:
+    """Serialize JSON-ready data to UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(data, indent=2 if pretty else None, default=str).encode('utf-8')
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse JSON from UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Most recently loaded screenshots by id(step), as (weakref to step, source,
+# bytes). Bounded, and entries vanish with their step, so idle steps' data
+# can be freed while an analysis pass reuses what it just decoded.
+_SCREENSHOT_CACHE_SIZE = 32
+_screenshot_cache: "OrderedDict[int, tuple[weakref.ref, tuple, bytes]]" = OrderedDict()
+# Steps are loaded from recorder, save() pool and UI threads. Reentrant,
+# because a weakref callback can run from GC while the lock is held.
+_screenshot_cache_lock = threading.RLock()
+
+
+def _cache_screenshot(step: "WorkflowStep", source: tuple, data: bytes):
+    """Remember a loaded screenshot, evicting the least recently used."""
+    key = id(step)
+    with _screenshot_cache_lock:
+        _screenshot_cache[key] = (weakref.ref(step, lambda ref: _forget_screenshot(key, ref)), source, data)
+        _screenshot_cache.move_to_end(key)
+        while len(_screenshot_cache) > _SCREENSHOT_CACHE_SIZE:
+            _screenshot_cache.popitem(last=False)
+
+
+def _cached_screenshot(step: "WorkflowStep", source: tuple) -> Optional[bytes]:
+    """Get a remembered screenshot if it was loaded from the same source."""
+    key = id(step)
+    with _screenshot_cache_lock:
+        entry = _screenshot_cache.get(key)
+        if entry is None or entry[0]() is not step or entry[1] != source:
+            return None
+        _screenshot_cache.move_to_end(key)
+        return entry[2]
+
+
+def _forget_screenshot(key: int, ref: weakref.ref):
+    """Weakref callback: drop a collected step's entry (not a newer one reusing its id)."""
+    with _screenshot_cache_lock:
+        entry = _screenshot_cache.get(key)
+        if entry is not None and entry[0] is ref:
+            del _screenshot_cache[key]
+
+
+# fdatasync skips flushing unrelated file metadata where the OS has it
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def _write_file(path: Path, data: bytes, durable: bool = False):
+    """Write bytes to a file, syncing them to disk only if durable."""
+    with open(path, 'wb') as f:
+        f.write(data)
+        if durable:
+            f.flush()
+            _fdatasync(f.fileno())
+
+
+def _sync_dir(directory: Path):
+    """Persist new directory entries (POSIX only)."""
+    if os.name != 'posix':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 class StepMetadata(BaseModel):
@@ -42,31 +154,103 @@ class WorkflowStep(BaseModel):
     step_number: int = Field(ge=1, description="Step sequence number")
     description: str = Field(description="User's description of the action")
     screenshot_path: Optional[str] = Field(default=None, description="Path to screenshot file")
+    screenshot_blob: Optional[tuple[int, int]] = Field(
+        default=None,
+        description="(offset, length) of the screenshot inside a packed screenshot_path"
+    )
     screenshot_base64: Optional[str] = Field(default=None, description="Base64 encoded screenshot")
+    # Raw screenshot held in memory until saved (not saved to JSON)
+    screenshot_bytes: Optional[bytes] = Field(default=None, exclude=True)
     metadata: StepMetadata = Field(default_factory=StepMetadata)
     
     def has_screenshot(self) -> bool:
         """Check if this step has a screenshot."""
-        return bool(self.screenshot_path or self.screenshot_base64)
+        return bool(self.screenshot_path or self.screenshot_bytes or self.screenshot_base64)
     
     def load_screenshot_bytes(self) -> Optional[bytes]:
-        """Load screenshot as bytes from file or base64."""
+        """Load screenshot as bytes from memory, base64 or file."""
+        if self.screenshot_bytes:
+            return self.screenshot_bytes
+        
+        # Reuse a recent decode/read unless the step's source has changed
+        source = self._screenshot_source()
+        data = _cached_screenshot(self, source)
+        if data is not None:
+            return data
+        
         if self.screenshot_base64:
-            return base64.b64decode(self.screenshot_base64)
-        elif self.screenshot_path:
-            path = Path(self.screenshot_path)
-            if path.exists():
-                return path.read_bytes()
-        return None
+            data = _b64decode(self.screenshot_base64)
+        else:
+            view = self.load_screenshot_view()
+            data = bytes(view) if view is not None else None
+        
+        if data is not None:
+            _cache_screenshot(self, source, data)
+        return data
     
-    def save_screenshot(self, directory: Path, image_bytes: bytes, format: str = "png"):
+    def _screenshot_source(self) -> tuple:
+        """Identify where the screenshot currently comes from, for caching."""
+        if self.screenshot_base64:
+            return (self.screenshot_base64,)
+        if self.screenshot_path:
+            try:
+                st = os.stat(self.screenshot_path)
+            except OSError:
+                return (None,)
+            return (self.screenshot_path, self.screenshot_blob, st.st_mtime_ns, st.st_size)
+        return (None,)
+    
+    def load_screenshot_view(self) -> Optional[memoryview]:
+        """
+        Load screenshot as a read-only buffer without copying file data.
+        
+        Screenshots on disk are memory-mapped; the mapping stays open for
+        as long as the returned memoryview is referenced.
+        """
+        if self.screenshot_bytes:
+            return memoryview(self.screenshot_bytes)
+        if self.screenshot_base64:
+            return memoryview(_b64decode(self.screenshot_base64))
+        if not self.screenshot_path:
+            return None
+        
+        # Open the stored string directly; no Path object or separate exists() check
+        try:
+            f = open(self.screenshot_path, 'rb')
+        except FileNotFoundError:
+            return None
+        with f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return memoryview(b"")
+            view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        
+        if self.screenshot_blob:
+            offset, length = self.screenshot_blob
+            return view[offset:offset + length]
+        return view
+    
+    def save_screenshot(
+        self,
+        directory: Path,
+        image_bytes: bytes,
+        format: str = "png",
+        durable: bool = False
+    ):
         """Save screenshot to file and update path."""
         filename = f"step_{self.step_number:03d}.{format}"
         filepath = directory / filename
-        filepath.write_bytes(image_bytes)
+        _write_file(filepath, image_bytes, durable)
         self.screenshot_path = str(filepath)
-        # Clear base64 to save memory
+        self.screenshot_blob = None
+        # Clear in-memory copies to save memory
+        self.screenshot_bytes = None
         self.screenshot_base64 = None
+    
+    def encode_screenshot(self) -> Optional[str]:
+        """Fill in screenshot_base64 from in-memory bytes, for JSON output."""
+        if self.screenshot_bytes and not self.screenshot_base64:
+            self.screenshot_base64 = _b64encode(self.screenshot_bytes).decode('ascii')
+        return self.screenshot_base64
 
     def get_screenshot_data(self) -> Optional[bytes]:
         """Alias for load_screenshot_bytes for UI compatibility."""
@@ -133,11 +317,18 @@ class Workflow(BaseModel):
     analyzed: bool = Field(default=False)
     analysis_results: Optional[Dict[str, Any]] = None
     
+    # Set when steps change; metadata.updated_at is stamped on the next save
+    _dirty: bool = PrivateAttr(default=False)
+    # Hash of the last step's screenshot, to share identical consecutive frames
+    _last_screenshot_hash: Optional[bytes] = PrivateAttr(default=None)
+    
     def add_step(
         self,
         description: str,
         screenshot_bytes: Optional[bytes] = None,
         screenshot_base64: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
+        screenshot_path: Optional[Path] = None,
         **metadata_kwargs
     ) -> WorkflowStep:
         """
@@ -145,31 +336,126 @@ class Workflow(BaseModel):
         
         Args:
             description: User's description of the action
-            screenshot_bytes: Raw screenshot bytes
+            screenshot_bytes: Raw screenshot bytes (kept as-is; only
+                base64 encoded if the workflow is saved without files)
             screenshot_base64: Base64 encoded screenshot
+            timestamp: Capture time; pass one precomputed value to stamp a
+                batch of steps without reading the clock for each
+            screenshot_path: Screenshot already written to disk; the step
+                references it instead of holding the bytes in memory
             **metadata_kwargs: Additional metadata fields
             
         Returns:
             The created WorkflowStep
         """
-        step_number = len(self.steps) + 1
-        
-        # Convert bytes to base64 if provided
-        if screenshot_bytes and not screenshot_base64:
-            screenshot_base64 = base64.b64encode(screenshot_bytes).decode('utf-8')
-        
-        step = WorkflowStep(
-            step_number=step_number,
-            description=description,
+        step = self._build_step(
+            len(self.steps) + 1,
+            description,
+            screenshot_bytes=screenshot_bytes,
             screenshot_base64=screenshot_base64,
-            metadata=StepMetadata(**metadata_kwargs)
+            timestamp=timestamp,
+            screenshot_path=screenshot_path,
+            **metadata_kwargs
         )
         
+        self._dedupe_screenshot(step)
         self.steps.append(step)
-        self.metadata.updated_at = datetime.now()
+        self._dirty = True
         
         return step
     
+    def add_steps(
+        self,
+        specs: List[Dict[str, Any]],
+        timestamp: Optional[datetime] = None
+    ) -> List[WorkflowStep]:
+        """
+        Add several steps at once.
+        
+        Args:
+            specs: One dict of add_step keyword arguments per step
+            timestamp: Capture time for specs that don't set their own;
+                defaults to a single datetime.now() for the whole batch
+            
+        Returns:
+            The created WorkflowSteps
+        """
+        start = len(self.steps) + 1
+        now = timestamp or datetime.now()
+        
+        new_steps = [
+            self._build_step(start + i, **{"timestamp": now, **spec})
+            for i, spec in enumerate(specs)
+        ]
+        
+        for step in new_steps:
+            self._dedupe_screenshot(step)
+            self.steps.append(step)
+        if new_steps:
+            self._dirty = True
+        
+        return new_steps
+    
+    def _dedupe_screenshot(self, step: WorkflowStep):
+        """
+        Share the previous step's screenshot if the new one is identical.
+        
+        Must be called before step is appended. Identical in-memory frames
+        end up as one bytes object (written to disk once on save); if the
+        previous frame is already on disk with the same bytes, the new step
+        just points at it.
+        """
+        data = step.screenshot_bytes
+        if not data:
+            self._last_screenshot_hash = None
+            return
+        
+        digest = _hash_screenshot(data)
+        previous_digest, self._last_screenshot_hash = self._last_screenshot_hash, digest
+        if digest != previous_digest or not self.steps:
+            return
+        
+        previous = self.steps[-1]
+        if previous.screenshot_bytes is not None:
+            if previous.screenshot_bytes == data:
+                step.screenshot_bytes = previous.screenshot_bytes
+        elif previous.screenshot_path:
+            # A 64-bit digest match is not proof; check the bytes on disk too
+            view = previous.load_screenshot_view()
+            if view is None or view != data:
+                return
+            step.screenshot_bytes = None
+            step.screenshot_path = previous.screenshot_path
+            step.screenshot_blob = previous.screenshot_blob
+    
+    @staticmethod
+    def _build_step(
+        step_number: int,
+        description: str,
+        screenshot_bytes: Optional[bytes] = None,
+        screenshot_base64: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
+        screenshot_path: Optional[Path] = None,
+        **metadata_kwargs
+    ) -> WorkflowStep:
+        """Create a step for add_step/add_steps."""
+        # Caller-supplied metadata (ISO timestamp strings, list positions)
+        # needs validating; a bare datetime is stored as-is
+        if metadata_kwargs or not (timestamp is None or isinstance(timestamp, datetime)):
+            metadata = StepMetadata(timestamp=timestamp or datetime.now(), **metadata_kwargs)
+        else:
+            metadata = StepMetadata.model_construct(timestamp=timestamp or datetime.now())
+        
+        # The remaining fields are set by this class, so skip re-validating them
+        return WorkflowStep.model_construct(
+            step_number=step_number,
+            description=description,
+            screenshot_bytes=None if screenshot_base64 else screenshot_bytes,
+            screenshot_base64=screenshot_base64,
+            screenshot_path=str(screenshot_path) if screenshot_path else None,
+            metadata=metadata
+        )
+    
     def get_step(self, step_number: int) -> Optional[WorkflowStep]:
         """Get a step by its number (1-indexed)."""
         if 1 <= step_number <= len(self.steps):
@@ -178,14 +464,33 @@ class Workflow(BaseModel):
     
     def remove_step(self, step_number: int) -> bool:
         """Remove a step by its number and renumber remaining steps."""
-        if 1 <= step_number <= len(self.steps):
-            self.steps.pop(step_number - 1)
-            # Renumber remaining steps
-            for i, step in enumerate(self.steps):
-                step.step_number = i + 1
-            self.metadata.updated_at = datetime.now()
-            return True
-        return False
+        return self.remove_steps([step_number]) == 1
+    
+    def remove_steps(self, step_numbers: List[int]) -> int:
+        """
+        Remove several steps by number in one pass.
+        
+        Remaining steps are renumbered once, starting from the first
+        removed position, instead of after every single removal.
+        
+        Returns:
+            Number of steps removed
+        """
+        drop = {n for n in step_numbers if 1 <= n <= len(self.steps)}
+        if not drop:
+            return 0
+        
+        first = min(drop) - 1
+        self.steps[first:] = [
+            step for i, step in enumerate(self.steps[first:], start=first + 1)
+            if i not in drop
+        ]
+        # Only steps after the first removal change number
+        for i in range(first, len(self.steps)):
+            self.steps[i].step_number = i + 1
+        self._dirty = True
+        self._last_screenshot_hash = None
+        return len(drop)
     
     @property
     def step_count(self) -> int:
@@ -197,17 +502,30 @@ class Workflow(BaseModel):
         """Get the number of transitions (steps - 1)."""
         return max(0, len(self.steps) - 1)
     
-    def save(self, directory: str | Path, save_screenshots: bool = True) -> Path:
+    def save(
+        self,
+        directory: str | Path,
+        save_screenshots: bool = True,
+        pretty: bool = False,
+        pack_screenshots: bool = False,
+        durable: bool = False
+    ) -> Path:
         """
         Save workflow to a directory.
         
         Creates:
         - workflow.json: Workflow data
-        - screenshots/: Directory with screenshot files
+        - screenshots/: Directory with screenshot files, or
+        - screenshots.blob: All screenshots packed into one file
         
         Args:
             directory: Directory to save to
             save_screenshots: Whether to save screenshots as files
+            pretty: Indent workflow.json for readability (default is compact)
+            pack_screenshots: Write all screenshots sequentially into a single
+                screenshots.blob instead of one file per step
+            durable: fsync every written file before returning. Off by
+                default, leaving writeback to the OS
             
         Returns:
             Path to the saved workflow directory
@@ -216,23 +534,95 @@ class Workflow(BaseModel):
         directory.mkdir(parents=True, exist_ok=True)
         
         # Save screenshots to files if requested
-        if save_screenshots:
+        if save_screenshots and pack_screenshots:
+            self._pack_screenshots(directory / "screenshots.blob", durable)
+        elif save_screenshots:
             screenshots_dir = directory / "screenshots"
             screenshots_dir.mkdir(exist_ok=True)
             
+            def write_step(step: WorkflowStep):
+                image_bytes = step.screenshot_bytes or _b64decode(step.screenshot_base64)
+                format = "webp" if image_bytes[8:12] == b"WEBP" else "png"
+                step.save_screenshot(screenshots_dir, image_bytes, format=format, durable=durable)
+            
+            # Steps sharing the previous step's bytes reuse its file
+            pending, shared = [], []
+            previous = None
             for step in self.steps:
-                if step.screenshot_base64:
-                    image_bytes = base64.b64decode(step.screenshot_base64)
-                    step.save_screenshot(screenshots_dir, image_bytes)
+                if previous is not None and step.screenshot_bytes is not None \
+                        and step.screenshot_bytes is previous.screenshot_bytes:
+                    shared.append((step, previous))
+                elif step.screenshot_bytes or step.screenshot_base64:
+                    pending.append(step)
+                previous = step
+            
+            # Each step writes its own file, so the writes can overlap
+            if pending:
+                with ThreadPoolExecutor(max_workers=min(8, len(pending))) as pool:
+                    list(pool.map(write_step, pending))
+            for step, source in shared:
+                step.screenshot_path = source.screenshot_path
+                step.screenshot_blob = None
+                step.screenshot_bytes = None
+            if durable:
+                _sync_dir(screenshots_dir)
+        else:
+            # In-memory screenshots are not part of the JSON, so embed them
+            pending = [s for s in self.steps if s.screenshot_bytes and not s.screenshot_base64]
+            if _B64_PARALLEL and len(pending) >= 8:
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                    list(pool.map(WorkflowStep.encode_screenshot, pending))
+            else:
+                for step in pending:
+                    step.encode_screenshot()
         
-        # Save workflow JSON
+        if self._dirty:
+            self.metadata.updated_at = datetime.now()
+            self._dirty = False
+        
+        # Save workflow JSON. Screenshots written to disk are referenced by
+        # path, so keep any base64 copies out of the dumped dict.
+        exclude = {'steps': {'__all__': {'screenshot_base64'}}} if save_screenshots else None
         workflow_file = directory / "workflow.json"
-        with open(workflow_file, 'w', encoding='utf-8') as f:
-            json.dump(self.model_dump(mode='json'), f, indent=2, default=str)
+        _write_file(
+            workflow_file,
+            _dump_json(self.model_dump(mode='json', exclude=exclude), pretty=pretty),
+            durable
+        )
+        if durable:
+            _sync_dir(directory)
         
         self.path = directory
         return directory
     
+    def _pack_screenshots(self, blob_path: Path, durable: bool = False):
+        """Write every step's screenshot into one blob and point steps at it."""
+        # Build into a temp file first: steps may still read from the old blob
+        tmp_path = blob_path.with_suffix(".blob.tmp")
+        packed = []
+        
+        with open(tmp_path, 'wb') as f:
+            last_bytes, last_blob = None, None
+            for step in self.steps:
+                image_bytes = step.load_screenshot_bytes()
+                if not image_bytes:
+                    continue
+                # Shared frames from _dedupe_screenshot are stored once
+                if image_bytes is not last_bytes:
+                    last_bytes, last_blob = image_bytes, (f.tell(), len(image_bytes))
+                    f.write(image_bytes)
+                packed.append((step, last_blob))
+            if durable:
+                f.flush()
+                _fdatasync(f.fileno())
+        os.replace(tmp_path, blob_path)
+        
+        for step, blob in packed:
+            step.screenshot_path = str(blob_path)
+            step.screenshot_blob = blob
+            step.screenshot_bytes = None
+            step.screenshot_base64 = None
+    
     @classmethod
     def load(cls, directory: str | Path) -> "Workflow":
         """
@@ -250,42 +640,67 @@ class Workflow(BaseModel):
         if not workflow_file.exists():
             raise FileNotFoundError(f"Workflow file not found: {workflow_file}")
         
-        with open(workflow_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json(workflow_file.read_bytes())
+        raw_steps = data.pop("steps", None) or []
         
         workflow = cls.model_validate(data)
+        
+        # Validate steps one at a time, decoding embedded screenshots to raw
+        # bytes and dropping each parsed dict, so base64 copies don't pile up
+        for i, raw_step in enumerate(raw_steps):
+            raw_steps[i] = None
+            step = WorkflowStep.model_validate(raw_step)
+            if step.screenshot_base64:
+                step.screenshot_bytes = _b64decode(step.screenshot_base64)
+                step.screenshot_base64 = None
+            workflow.steps.append(step)
+        
         workflow.path = directory
         return workflow
     
-    def get_screenshot_pairs(self) -> List[tuple[WorkflowStep, WorkflowStep]]:
+    def get_screenshot_pairs(self) -> Iterator[tuple[WorkflowStep, WorkflowStep]]:
         """
         Get pairs of consecutive steps for transition analysis.
         
         Returns:
-            List of (before, after) step tuples
+            Iterator of (before, after) step tuples; use transition_count
+            for the number of pairs
         """
-        pairs = []
-        for i in range(len(self.steps) - 1):
-            pairs.append((self.steps[i], self.steps[i + 1]))
-        return pairs
-    
-    def summary(self) -> str:
-        """Get a text summary of the workflow."""
-        lines = [
-            f"Workflow: {self.name}",
-            f"Description: {self.description or 'No description'}",
-            f"Steps: {self.step_count}",
-            f"Created: {self.metadata.created_at}",
-            f"Analyzed: {'Yes' if self.analyzed else 'No'}",
-            "",
-            "Steps:",
-        ]
+        return pairwise(self.steps)
+    
+    def summary(self, file: Optional[TextIO] = None) -> Optional[str]:
+        """
+        Get a text summary of the workflow.
         
-        for step in self.steps:
-            has_img = "📸" if step.has_screenshot() else "  "
-            lines.append(f"  {step.step_number}. {has_img} {step.description}")
+        Args:
+            file: Optional text stream to write the summary to line by line
+            
+        Returns:
+            The summary string, or None if it was written to file
+        """
+        header = (
+            f"Workflow: {self.name}\n"
+            f"Description: {self.description or 'No description'}\n"
+            f"Steps: {self.step_count}\n"
+            f"Created: {self.metadata.created_at}\n"
+            f"Analyzed: {'Yes' if self.analyzed else 'No'}\n"
+            "\n"
+            "Steps:"
+        )
+        step_lines = (
+            "  %d. %s %s" % (step.step_number, _YES if step.has_screenshot() else _NO, step.description)
+            for step in self.steps
+        )
+        
+        if file is None:
+            return "\n".join([header, *step_lines])
         
-        return "\n".join(lines)
+        file.write(header)
+        for line in step_lines:
+            file.write("\n")
+            file.write(line)
+        file.write("\n")
+        return None
     
     def __str__(self) -> str:
         return f"Workflow(name='{self.name}', steps={self.step_count})"
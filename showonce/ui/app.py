@@ -5,11 +5,15 @@ Run with: streamlit run showonce/ui/app.py
 """
 
 import streamlit as st
+import os
+import re
+import shutil
 import sys
 from pathlib import Path
 from datetime import datetime
 import json
 import base64
+import gc
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -18,10 +22,13 @@ sys.path.insert(0, str(project_root))
 from showonce.config import get_config
 from showonce.models.workflow import Workflow
 from showonce.models.actions import ActionSequence, ActionType
-from showonce.generate.runner import ScriptRunner
-from showonce.capture.recorder import RecordingSession
 import threading
-import time
+
+# Characters not allowed in workflow directory names
+_UNSAFE_NAME_RE = re.compile(r"[^\w-]")
+
+# Steps shown per page in the steps tab
+STEPS_PAGE_SIZE = 20
 
 
 # Page configuration
@@ -69,33 +76,92 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+@st.cache_resource(show_spinner=False)
+def _cfg():
+    """Resolve the configuration once per server process rather than per rerun."""
+    return get_config()
+
+
+def _workflow_stamps(workflows_dir: str) -> tuple:
+    """(directory name, workflow.json mtime) for each saved workflow, sorted by name."""
+    stamps = []
+    with os.scandir(workflows_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            try:
+                mtime_ns = os.stat(os.path.join(entry.path, "workflow.json")).st_mtime_ns
+            except OSError:
+                continue
+            stamps.append((entry.name, mtime_ns))
+    return tuple(sorted(stamps))
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _load_workflows_cached(workflows_dir: str, stamps: tuple):
+    """Load workflow summaries; cached until any workflow.json is added, removed or saved."""
+    workflows = []
+    errors = []
+    
+    for name, _ in stamps:
+        path = Path(workflows_dir) / name
+        try:
+            wf = Workflow.load(path)
+            workflows.append({
+                "name": wf.name,
+                "description": wf.description,
+                "steps": wf.step_count,
+                "analyzed": wf.analyzed,
+                "created": wf.metadata.created_at,
+                "path": str(path)
+            })
+        except Exception as e:
+            errors.append(f"Error loading {name}: {e}")
+    
+    return workflows, errors
+
+
 def get_workflows():
     """Get all workflows from the workflows directory."""
-    config = get_config()
-    workflows = []
+    config = _cfg()
     
     workflows_dir = config.paths.workflows_dir
-    if workflows_dir.exists():
-        for path in workflows_dir.iterdir():
-            if path.is_dir() and (path / "workflow.json").exists():
-                try:
-                    wf = Workflow.load(path)
-                    workflows.append({
-                        "name": wf.name,
-                        "description": wf.description,
-                        "steps": wf.step_count,
-                        "analyzed": wf.analyzed,
-                        "created": wf.metadata.created_at,
-                        "path": path
-                    })
-                except Exception as e:
-                    st.error(f"Error loading {path.name}: {e}")
-    
+    if not workflows_dir.exists():
+        return []
+    
+    # Saving a workflow touches only its own workflow.json, not the parent
+    # directory, so key the cache on every file's mtime
+    workflows_dir = str(workflows_dir)
+    workflows, errors = _load_workflows_cached(workflows_dir, _workflow_stamps(workflows_dir))
+    for error in errors:
+        st.error(error)
     return workflows
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def _load_workflow(path_str: str, mtime_ns: int) -> Workflow:
+    """Load a workflow; cached per workflow.json modification time."""
+    return Workflow.load(Path(path_str))
+
+
+def load_workflow(path) -> Workflow:
+    """
+    Load a workflow, reusing the cached parse while it is unchanged on disk.
+    
+    Each call returns its own copy, so callers may change and save it
+    without other sessions seeing unsaved edits.
+    """
+    mtime_ns = (Path(path) / "workflow.json").stat().st_mtime_ns
+    return _load_workflow(str(path), mtime_ns)
+
 
+def invalidate_workflows():
+    """Drop cached workflows and summaries after the app changes a workflow."""
+    _load_workflows_cached.clear()
+    _load_workflow.clear()
 
+
+@st.fragment
 def render_recording_section():
     """Render the live recording interface."""
     if "recording_active" not in st.session_state:
@@ -130,8 +196,8 @@ def render_recording_section():
             
             if st.button("📸 Manual Capture", width="stretch"):
                 session.request_capture()
-                time.sleep(0.5)
-                st.rerun()
+                session.wait_for_capture(timeout=1.5)
+                st.rerun(scope="fragment")
             
             if st.button("⏹️ Finish & Save", type="primary", width="stretch"):
                 stop_live_recording()
@@ -141,13 +207,15 @@ def render_recording_section():
 
         with col_preview:
             st.subheader("Live Preview")
-            if session.last_screenshot:
-                st.image(session.last_screenshot, caption="Last Captured Step", width="stretch")
+            if session.last_screenshot_bytes:
+                st.image(session.last_screenshot_bytes, caption="Last Captured Step", width="stretch")
             else:
                 st.info("No steps captured yet. Use your hotkey or click elsewhere to capture.")
 
 def start_live_recording(name, desc, auto_capture=False):
     """Start the recorder in a background thread."""
+    from showonce.capture.recorder import RecordingSession
+    
     session = RecordingSession(name, desc, no_prompt=True, auto_capture=auto_capture)
     st.session_state.recording_session = session
     st.session_state.recording_active = True
@@ -160,22 +228,42 @@ def start_live_recording(name, desc, auto_capture=False):
 
 def stop_live_recording():
     """Stop the recording session."""
-    if "recording_session" in st.session_state:
-        session = st.session_state.recording_session
+    if "recording_session" not in st.session_state:
+        return
+    
+    session = st.session_state.recording_session
+    try:
         session.stop()
+        # Wake as soon as the final save completes
+        session.wait_for_capture(timeout=1)
+    finally:
+        # Always drop the session and join its thread, even if saving failed,
+        # so repeated start/stop cycles don't accumulate threads and frames
         st.session_state.recording_active = False
-        # Give it a second to save
-        time.sleep(1)
-        
-        if session.workflow.step_count > 0:
-            st.success(f"Workflow '{st.session_state.recording_name}' saved with {session.workflow.step_count} steps!")
-        else:
-            st.warning(f"No steps captured for '{st.session_state.recording_name}'. Process stopped.")
-        
-        # Cleanup session state
-        del st.session_state.recording_session
-        if "recording_thread" in st.session_state:
-            del st.session_state.recording_thread
+        st.session_state.pop("recording_session", None)
+        thread = st.session_state.pop("recording_thread", None)
+        if thread is not None:
+            thread.join(timeout=2)
+        session.last_screenshot_bytes = None
+        invalidate_workflows()
+        gc.collect()
+    
+    if session.workflow.step_count > 0:
+        st.success(f"Workflow '{st.session_state.recording_name}' saved with {session.workflow.step_count} steps!")
+    else:
+        st.warning(f"No steps captured for '{st.session_state.recording_name}'. Process stopped.")
+
+@st.cache_data(show_spinner=False)
+def _card_html(name, description, steps, analyzed):
+    """Build the HTML for a dashboard workflow card."""
+    status = "✅ Analyzed" if analyzed else "⏳ Pending"
+    return f"""
+    <div class="workflow-card">
+        <h4>{name}</h4>
+        <p>{description or 'No description'}</p>
+        <p><strong>{steps}</strong> steps | {status}</p>
+    </div>
+    """
 
 def render_dashboard(workflows):
     """Render the main dashboard."""
@@ -205,8 +293,10 @@ def render_dashboard(workflows):
     col1, col2, col3, col4 = st.columns(4)
     
     total = len(workflows)
-    analyzed = sum(1 for w in workflows if w["analyzed"])
-    total_steps = sum(w["steps"] for w in workflows)
+    analyzed = total_steps = 0
+    for w in workflows:
+        analyzed += w["analyzed"]
+        total_steps += w["steps"]
     
     with col1:
         st.metric("Total Workflows", total)
@@ -227,28 +317,29 @@ def render_dashboard(workflows):
         st.code("python -m showonce.cli record --name my_workflow", language="bash")
         return
     
-    # Display in grid
+    # Display in grid: one markdown emit per column, then that column's buttons
     cols = st.columns(3)
-    for i, wf in enumerate(workflows):
-        with cols[i % 3]:
-            with st.container():
-                status = "✅ Analyzed" if wf["analyzed"] else "⏳ Pending"
-                st.markdown(f"""
-                <div class="workflow-card">
-                    <h4>{wf['name']}</h4>
-                    <p>{wf['description'] or 'No description'}</p>
-                    <p><strong>{wf['steps']}</strong> steps | {status}</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                if st.button(f"View Details", key=f"view_{wf['name']}"):
+    for col_idx, col in enumerate(cols):
+        col_workflows = workflows[col_idx::3]
+        if not col_workflows:
+            continue
+        with col:
+            st.markdown(
+                "".join(
+                    _card_html(wf["name"], wf["description"], wf["steps"], wf["analyzed"])
+                    for wf in col_workflows
+                ),
+                unsafe_allow_html=True
+            )
+            for wf in col_workflows:
+                if st.button(f"View {wf['name']}", key=f"view_{wf['name']}"):
                     st.session_state.selected_workflow = wf['name']
                     st.rerun()
 
 def create_workflow_ui(name, description):
     """Create a new workflow directory and JSON."""
-    config = get_config()
-    safe_name = "".join([c if c.isalnum() or c in "-_" else "_" for c in name])
+    config = _cfg()
+    safe_name = _UNSAFE_NAME_RE.sub("_", name)
     wf_path = config.paths.workflows_dir / safe_name
     
     if wf_path.exists():
@@ -260,6 +351,7 @@ def create_workflow_ui(name, description):
         wf = Workflow(name=name, description=description)
         wf.path = wf_path
         wf.save(wf_path)
+        invalidate_workflows()
         st.success(f"Workflow '{name}' created successfully!")
         
         # Set session state to jump to this workflow
@@ -269,6 +361,7 @@ def create_workflow_ui(name, description):
     except Exception as e:
         st.error(f"Failed to create workflow: {e}")
 
+@st.fragment
 def render_workflow_viewer(workflow_name, workflows):
     """Render detailed workflow view."""
     st.markdown(f'<p class="main-header">🔍 Workflow: {workflow_name}</p>', unsafe_allow_html=True)
@@ -281,7 +374,7 @@ def render_workflow_viewer(workflow_name, workflows):
     
     # Load workflow
     try:
-        workflow = Workflow.load(workflow_info["path"])
+        workflow = load_workflow(workflow_info["path"])
     except Exception as e:
         st.error(f"Error loading workflow: {e}")
         return
@@ -301,6 +394,54 @@ def render_workflow_viewer(workflow_name, workflows):
     with tab4:
         render_info_tab(workflow)
 
+@st.cache_data(max_entries=256, show_spinner=False)
+def _screenshot_bytes(path_str: str, blob, mtime_ns: int) -> bytes:
+    """Read a screenshot file (or a slice of a packed one); cached per mtime."""
+    with open(path_str, "rb") as f:
+        if blob is None:
+            return f.read()
+        offset, length = blob
+        f.seek(offset)
+        return f.read(length)
+
+
+def step_screenshot(step):
+    """Get a step's screenshot bytes, reading on-disk screenshots through the cache."""
+    if step.screenshot_bytes or not step.screenshot_path:
+        return step.get_screenshot_data()
+    try:
+        mtime_ns = os.stat(step.screenshot_path).st_mtime_ns
+    except OSError:
+        return None
+    return _screenshot_bytes(step.screenshot_path, step.screenshot_blob, mtime_ns)
+
+def save_upload(uploaded_file, directory: Path, stem: str, max_edge: int = 1920) -> Path:
+    """
+    Write an uploaded screenshot straight to disk.
+    
+    The image is downscaled and re-encoded as WebP; if Pillow cannot handle
+    it, the original upload is copied through in 256 KiB chunks instead.
+    """
+    from PIL import Image
+    
+    directory.mkdir(parents=True, exist_ok=True)
+    dest = directory / f"{stem}.webp"
+    # Encode next to the target and rename, so a failed encode leaves no partial file
+    tmp = dest.with_suffix(".webp.tmp")
+    try:
+        with Image.open(uploaded_file) as img:
+            img.thumbnail((max_edge, max_edge), Image.LANCZOS)
+            img.save(tmp, format="WEBP", quality=85, method=4)
+        os.replace(tmp, dest)
+        return dest
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        uploaded_file.seek(0)
+        dest = directory / f"{stem}{Path(uploaded_file.name).suffix.lower() or '.png'}"
+        with open(dest, "wb") as f:
+            shutil.copyfileobj(uploaded_file, f, length=262144)
+        return dest
+
 def render_steps_tab(workflow):
     """Render the steps tab with screenshots and upload functionality."""
     
@@ -311,11 +452,30 @@ def render_steps_tab(workflow):
         if workflow.step_count == 0:
             st.info("No steps captured yet.")
         else:
-            for step in workflow.steps:
+            # Only build widgets for one page of steps per rerun
+            page_key = f"steps_page_{workflow.name}"
+            last_page = (workflow.step_count - 1) // STEPS_PAGE_SIZE
+            page = min(st.session_state.setdefault(page_key, 0), last_page)
+            
+            if last_page > 0:
+                p_col1, p_col2, p_col3 = st.columns([1, 2, 1])
+                with p_col1:
+                    if st.button("◀ Prev", key=f"{page_key}_prev", disabled=page == 0):
+                        st.session_state[page_key] = page - 1
+                        st.rerun(scope="fragment")
+                with p_col2:
+                    st.caption(f"Page {page + 1} of {last_page + 1}")
+                with p_col3:
+                    if st.button("Next ▶", key=f"{page_key}_next", disabled=page == last_page):
+                        st.session_state[page_key] = page + 1
+                        st.rerun(scope="fragment")
+            
+            start = page * STEPS_PAGE_SIZE
+            for step in workflow.steps[start:start + STEPS_PAGE_SIZE]:
                 with st.expander(f"Step {step.step_number}: {step.description or 'No description'}", expanded=False):
                     s_col1, s_col2 = st.columns([3, 1])
                     with s_col1:
-                        screenshot_data = step.get_screenshot_data()
+                        screenshot_data = step_screenshot(step)
                         if screenshot_data:
                             st.image(screenshot_data, width="stretch")
                         else:
@@ -332,22 +492,47 @@ def render_steps_tab(workflow):
         if uploaded_files:
             if st.button("Add to Workflow"):
                 with st.spinner("Processing uploads..."):
+                    screenshots_dir = Path(workflow.path) / "screenshots"
+                    batch = datetime.now().strftime("%Y%m%d%H%M%S")
                     for uploaded_file in uploaded_files:
-                        img_bytes = uploaded_file.read()
+                        stem = f"upload_{batch}_{workflow.step_count + 1:03d}"
                         workflow.add_step(
                             description=uploaded_file.name,
-                            screenshot_bytes=img_bytes
+                            screenshot_path=save_upload(uploaded_file, screenshots_dir, stem)
                         )
                     workflow.save(workflow.path)
+                    invalidate_workflows()
+                    gc.collect()
                     st.success(f"Added {len(uploaded_files)} steps!")
                     st.rerun()
 
+@st.cache_data(max_entries=64, show_spinner=False)
+def _read_text(path_str: str, mtime_ns: int, size: int) -> str:
+    """Read a UTF-8 file in one sized read; cached per file version."""
+    fd = os.open(path_str, os.O_RDONLY)
+    try:
+        data = os.read(fd, size)
+        # Pick up anything a short read or a concurrent write left behind
+        while chunk := os.read(fd, 65536):
+            data += chunk
+    finally:
+        os.close(fd)
+    return data.decode("utf-8")
+
 def render_generated_code_tab(workflow_name):
     """Show existing generated scripts for this workflow."""
-    config = get_config()
+    config = _cfg()
     st.subheader("Generated Scripts")
     
-    scripts = list(config.paths.output_dir.glob(f"{workflow_name}_*.py"))
+    output_dir = config.paths.output_dir
+    prefix = f"{workflow_name}_"
+    scripts = []
+    if output_dir.exists():
+        with os.scandir(output_dir) as entries:
+            scripts = [
+                Path(entry.path) for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(".py") and entry.is_file()
+            ]
     
     if not scripts:
         st.info("No scripts generated yet. Go to the 'Generate Code' page to create one.")
@@ -358,8 +543,8 @@ def render_generated_code_tab(workflow_name):
         for script_path in scripts:
             framework = script_path.stem.split('_')[-1]
             with st.expander(f"📜 {script_path.name} ({framework})"):
-                with open(script_path, "r") as f:
-                    code = f.read()
+                stat = script_path.stat()
+                code = _read_text(str(script_path), stat.st_mtime_ns, stat.st_size)
                 st.code(code, language="python")
                 st.download_button(
                     label="Download Script",
@@ -371,12 +556,25 @@ def render_generated_code_tab(workflow_name):
                 st.divider()
                 render_script_runner(script_path)
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def _script_info(path_str: str, mtime_ns: int):
+    """Parse a script's info; cached per script version."""
+    from showonce.generate.runner import ScriptRunner
+    return ScriptRunner(Path(path_str)).get_script_info()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _check_dependencies(path_str: str, mtime_ns: int):
+    """Check a script's imports; cached briefly since installs can change."""
+    from showonce.generate.runner import ScriptRunner
+    return ScriptRunner(Path(path_str)).check_dependencies()
+
 def render_script_runner(script_path):
     """Render interface to run a script."""
     st.markdown("### 🚀 Run Automation")
     
-    runner = ScriptRunner(script_path)
-    info = runner.get_script_info()
+    mtime_ns = script_path.stat().st_mtime_ns
+    info = _script_info(str(script_path), mtime_ns)
     
     if "error" in info:
         st.error(f"Error parsing script info: {info['error']}")
@@ -395,14 +593,17 @@ def render_script_runner(script_path):
     if run_btn:
         with st.status("Executing automation...", expanded=True) as status:
             st.write("Checking dependencies...")
-            all_installed, missing = runner.check_dependencies()
+            all_installed, missing = _check_dependencies(str(script_path), mtime_ns)
             if not all_installed:
                 st.error(f"Missing dependencies: {', '.join(missing)}")
                 st.info("Run `pip install " + " ".join(missing) + "` in your terminal.")
                 return
                 
             st.write("Starting browser...")
-            result = runner.run(params=params)
+            # Runners snapshot os.environ when built, so build one per run to
+            # pass on variables set since the script was first shown
+            from showonce.generate.runner import ScriptRunner
+            result = ScriptRunner(script_path).run(params=params)
             
             if result["success"]:
                 status.update(label="✅ Execution Successful!", state="complete")
@@ -426,7 +627,7 @@ def render_analysis_tab(workflow, workflow_info):
     if not workflow_info["analyzed"]:
         st.warning("This workflow has not been analyzed yet.")
         
-        config = get_config()
+        config = _cfg()
         if not config.analyze.api_key:
             st.error("⚠️ ANTHROPIC_API_KEY not configured. Set it in the Settings page.")
         else:
@@ -441,13 +642,33 @@ def render_analysis_tab(workflow, workflow_info):
         # Display existing analysis if possible (simplified for now as we don't store action sequence separately yet)
         st.info("View inferred actions by running re-analysis or checking generated code.")
 
+@st.cache_resource(show_spinner=False)
+def _engine():
+    """Shared inference engine, so its API client and connection pool are reused."""
+    from showonce.analyze import ActionInferenceEngine
+    return ActionInferenceEngine()
+
+
+def _generator(framework, headless):
+    """
+    Code generator per framework/headless combination, kept for this session.
+    
+    Generators hold state while generating (e.g. selenium's locator cache),
+    so they are not shared between concurrent sessions.
+    """
+    generators = st.session_state.setdefault("generators", {})
+    key = (framework, headless)
+    if key not in generators:
+        from showonce.generate import get_generator
+        generators[key] = get_generator(framework, headless=headless)
+    return generators[key]
+
+
 def analyze_workflow_ui(workflow):
     """Run analysis with progress UI."""
-    from showonce.analyze import ActionInferenceEngine
-    
     with st.spinner("Analyzing workflow with Claude Vision..."):
         try:
-            engine = ActionInferenceEngine()
+            engine = _engine()
             
             progress_bar = st.progress(0)
             status_text = st.empty()
@@ -476,9 +697,13 @@ def analyze_workflow_ui(workflow):
             
             workflow.analyzed = True
             workflow.save(workflow.path)
+            invalidate_workflows()
             
         except Exception as e:
             st.error(f"Analysis failed: {e}")
+    
+    # Reclaim screenshot buffers from the analysis; hot render paths skip this
+    gc.collect()
 
 def render_info_tab(workflow):
     """Render workflow info tab."""
@@ -523,19 +748,16 @@ def render_generate_page(workflow_name, workflows):
 
 def generate_code_ui(workflow_name, workflow_info, framework, headless):
     """Generate code and show results."""
-    from showonce.generate import get_generator
-    from showonce.analyze import ActionInferenceEngine
-    
     try:
-        workflow = Workflow.load(workflow_info["path"])
+        workflow = load_workflow(workflow_info["path"])
         
         with st.status(f"Generating {framework} code...") as status:
             st.write("Analyzing transitions...")
-            engine = ActionInferenceEngine()
+            engine = _engine()
             action_sequence = engine.analyze_workflow(workflow)
             
             st.write("Building script...")
-            generator = get_generator(framework, headless=headless)
+            generator = _generator(framework, headless)
             code = generator.generate(action_sequence)
             
             status.update(label="Generation Complete!", state="complete")
@@ -547,7 +769,7 @@ def generate_code_ui(workflow_name, workflow_info, framework, headless):
         with col1:
             st.download_button("Download Python Script", code, file_name=f"{workflow_name}_{framework}.py")
         with col2:
-            config = get_config()
+            config = _cfg()
             output_path = config.paths.output_dir / f"{workflow_name}_{framework}.py"
             generator.save(code, output_path)
             st.success(f"Saved to {output_path}")
@@ -559,7 +781,7 @@ def render_settings_page():
     """Render the settings page."""
     st.markdown('<p class="main-header">⚙️ Settings</p>', unsafe_allow_html=True)
     
-    config = get_config()
+    config = _cfg()
     
     st.subheader("Anthropic API Key")
     current_key = config.analyze.api_key
@@ -583,7 +805,6 @@ def render_settings_page():
     st.write("**Generated Scripts:**", str(config.paths.output_dir))
     
     if st.button("Open Config Directory"):
-        import os
         os.startfile(config.paths.base_dir)
 
 def main():
@@ -593,6 +814,9 @@ def main():
     if "page" not in st.session_state:
         st.session_state.page = "📊 Dashboard"
     
+    # One cached scan per rerun, shared by the sidebar and every page
+    workflows = get_workflows()
+    
     # Sidebar
     with st.sidebar:
         st.title("🎯 ShowOnce")
@@ -603,7 +827,6 @@ def main():
         st.session_state.page = page
         
         st.divider()
-        workflows = get_workflows()
         if workflows:
             st.subheader("Recent Workflows")
             for wf in workflows[:5]:
@@ -4,13 +4,18 @@ Logging configuration for ShowOnce.
 Provides consistent, beautiful logging using Rich library.
 """
 
+import atexit
+import functools
 import logging
+import os
+import queue
+import re
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 from pathlib import Path
 
-from rich.console import Console
-from rich.logging import RichHandler
 from rich.theme import Theme
 
 # Custom theme for ShowOnce
@@ -22,22 +27,196 @@ SHOWONCE_THEME = Theme({
     "step": "magenta",
 })
 
-# Shared console instance
-console = Console(theme=SHOWONCE_THEME)
+
+
+@functools.cache
+def _console():
+    """Shared console instance, created (with terminal detection) on first use."""
+    from rich.console import Console
+    return Console(theme=SHOWONCE_THEME)
+
+
+def __getattr__(name: str):
+    # Keep `from showonce.utils.logger import console` working without
+    # constructing the console at import time
+    if name == "console":
+        return _console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.cache
+def _text():
+    """rich.text.Text, imported on first use."""
+    from rich.text import Text
+    return Text
+
+
+@functools.cache
+def _banner():
+    """Startup banner, parsed from markup once."""
+    return _text().from_markup("""
+[bold cyan]
+  ███████╗██╗  ██╗ ██████╗ ██╗    ██╗ ██████╗ ███╗   ██╗ ██████╗███████╗
+  ██╔════╝██║  ██║██╔═══██╗██║    ██║██╔═══██╗████╗  ██║██╔════╝██╔════╝
+  ███████╗███████║██║   ██║██║ █╗ ██║██║   ██║██╔██╗ ██║██║     █████╗  
+  ╚════██║██╔══██║██║   ██║██║███╗██║██║   ██║██║╚██╗██║██║     ██╔══╝  
+  ███████║██║  ██║╚██████╔╝╚███╔███╔╝╚██████╔╝██║ ╚████║╚██████╗███████╗
+  ╚══════╝╚═╝  ╚═╝ ╚═════╝  ╚══╝╚══╝  ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝
+[/bold cyan]
+[dim]Show me once. I'll do it forever.[/dim]
+        """)
+
+
+# Progress bars for every fill level, indexed by filled cells
+_BAR_LENGTH = 20
+_BARS = ["█" * i + "░" * (_BAR_LENGTH - i) for i in range(_BAR_LENGTH + 1)]
+
+# Emoji and symbols dropped from plain-text copies of console messages
+_EMOJI_RE = re.compile("[\U0001F000-\U0001FFFF\u2190-\u21FF\u2600-\u27BF\uFE0F]")
+
+# Record attribute marking messages that were already printed to the console
+_CONSOLE_PRINTED = "showonce_console_printed"
+
+# Root name for all ShowOnce loggers
+_LOGGER_PREFIX = sys.intern("showonce")
+
+# Background listener that renders/writes records queued by setup_logging
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener():
+    """Stop the background log listener and flush/close its handlers."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    Queue records untouched for the in-process listener.
+    
+    QueueHandler.prepare pre-formats the message and drops exc_info so
+    records can cross process boundaries; ours never leave the process, so
+    the listener's handlers get the original record and render tracebacks
+    themselves.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _GuardedQueueListener(QueueListener):
+    """QueueListener whose thread survives a handler failing on one record."""
+    
+    def handle(self, record: logging.LogRecord):
+        record = self.prepare(record)
+        for handler in self.handlers:
+            if self.respect_handler_level and record.levelno < handler.level:
+                continue
+            try:
+                handler.handle(record)
+            except Exception:
+                # e.g. Rich markup errors; report like logging does and move on
+                handler.handleError(record)
+
+
+class BufferedFileHandler(logging.Handler):
+    """
+    Append log records to a file in large chunks.
+    
+    Formatted records collect in memory and are written with a single
+    os.write once 64 KiB is pending, a WARNING or worse arrives, max_delay
+    seconds pass after the first buffered record, or the handler is
+    flushed/closed. Meant to run on the QueueListener thread, so producers
+    never write.
+    """
+    
+    def __init__(self, filename: str, chunk_size: int = 64 * 1024, max_delay: float = 1.0):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.chunk_size = chunk_size
+        self.max_delay = max_delay
+        self._fd = os.open(self.baseFilename, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._pending: list[bytes] = []
+        self._pending_size = 0
+        # Writes out a quiet buffer, so a burst is not held until the next record
+        self._timer: Optional[threading.Timer] = None
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            data = (self.format(record) + "\n").encode("utf-8")
+        except Exception:
+            self.handleError(record)
+            return
+        self._pending.append(data)
+        self._pending_size += len(data)
+        if self._pending_size >= self.chunk_size or record.levelno >= logging.WARNING:
+            self.flush()
+        elif self._timer is None:
+            self._timer = threading.Timer(self.max_delay, self._flush_later)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def _flush_later(self):
+        """Timer callback: write whatever is still pending."""
+        self.acquire()
+        try:
+            self._timer = None
+            self.flush()
+        finally:
+            self.release()
+    
+    def flush(self):
+        """Write all pending records in one chunk."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending or self._fd is None:
+            return
+        data = b"".join(self._pending)
+        self._pending.clear()
+        self._pending_size = 0
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+    
+    def close(self):
+        self.acquire()
+        try:
+            self.flush()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        finally:
+            self.release()
+            super().close()
 
 
 def setup_logging(
     level: str = "INFO",
     log_file: Optional[str] = None,
-    show_path: bool = False
+    show_path: bool = False,
+    show_locals: bool = False
 ) -> logging.Logger:
     """
     Set up logging for ShowOnce.
     
+    Log calls only enqueue records; a background QueueListener does the
+    Rich rendering and file writes, so callers never block on output.
+    
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Optional file path to write logs to
         show_path: Whether to show file paths in log output
+        show_locals: Whether tracebacks include each frame's local
+            variables (costly; meant for debugging)
         
     Returns:
         Configured logger instance
@@ -49,16 +228,20 @@ def setup_logging(
     handlers = []
     
     # Rich console handler (pretty output)
+    from rich.logging import RichHandler
+    
     rich_handler = RichHandler(
-        console=console,
+        console=_console(),
         show_time=True,
         show_level=True,
         show_path=show_path,
         rich_tracebacks=True,
-        tracebacks_show_locals=True,
+        tracebacks_show_locals=show_locals,
         markup=True,
     )
     rich_handler.setLevel(log_level)
+    # Messages printed directly by ShowOnceLogger are only echoed to files
+    rich_handler.addFilter(lambda record: not getattr(record, _CONSOLE_PRINTED, False))
     handlers.append(rich_handler)
     
     # File handler if specified
@@ -66,7 +249,7 @@ def setup_logging(
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = BufferedFileHandler(log_file)
         file_handler.setLevel(log_level)
         file_formatter = logging.Formatter(
             '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
@@ -75,10 +258,24 @@ def setup_logging(
         file_handler.setFormatter(file_formatter)
         handlers.append(file_handler)
     
+    # Replace any previous listener, then route the root logger through a queue
+    global _listener
+    _stop_listener()
+    
+    log_queue = queue.SimpleQueue()
+    if rich_handler.formatter is None:
+        # Keep the console format basicConfig used to give the handler directly
+        rich_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    _listener = _GuardedQueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    
+    # Records are queued as-is; the listener's handlers apply their own formats
+    queue_handler = _RecordQueueHandler(log_queue)
+    
     # Configure root logger
     logging.basicConfig(
         level=log_level,
-        handlers=handlers,
+        handlers=[queue_handler],
         force=True  # Override any existing configuration
     )
     
@@ -99,8 +296,15 @@ def get_logger(name: str = "showonce") -> logging.Logger:
     Returns:
         Logger instance
     """
-    if not name.startswith("showonce"):
-        name = f"showonce.{name}"
+    if not name.startswith(_LOGGER_PREFIX):
+        name = f"{_LOGGER_PREFIX}.{name}"
+    # Interned names hash once and compare by identity in the caches
+    return _resolve_logger(sys.intern(name))
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_logger(name: str) -> logging.Logger:
+    """Look up a logger once per name, skipping the logging manager's lock."""
     return logging.getLogger(name)
 
 
@@ -114,47 +318,58 @@ class ShowOnceLogger:
     
     def __init__(self, name: str = "showonce"):
         self.logger = get_logger(name)
-        self.console = console
-    
-    def info(self, message: str):
-        """Log info message."""
-        self.logger.info(message)
     
-    def debug(self, message: str):
-        """Log debug message."""
-        self.logger.debug(message)
+    @property
+    def console(self):
+        """Shared Rich console, created on first use."""
+        return _console()
     
-    def warning(self, message: str):
-        """Log warning message."""
-        self.logger.warning(message)
+    def _log(self, level: int, message: str, *args, exc_info: bool = False):
+        """Log at level; pass args for lazy %-style formatting."""
+        if self.logger.isEnabledFor(level):
+            # stacklevel=2 attributes the record to our caller, not this wrapper
+            self.logger.log(level, message, *args, exc_info=exc_info, stacklevel=2)
     
-    def error(self, message: str, exc_info: bool = False):
-        """Log error message."""
-        self.logger.error(message, exc_info=exc_info)
+    info = functools.partialmethod(_log, logging.INFO)
+    debug = functools.partialmethod(_log, logging.DEBUG)
+    warning = functools.partialmethod(_log, logging.WARNING)
+    error = functools.partialmethod(_log, logging.ERROR)
     
     def success(self, message: str):
         """Log success message (shows as info with green styling)."""
         self.console.print(f"[success]✓ {message}[/success]")
+        self._to_file(message)
     
     def step(self, step_num: int, message: str):
         """Log a workflow step."""
-        self.console.print(f"[step]Step {step_num}:[/step] {message}")
+        self.console.print(_text().assemble((f"Step {step_num}:", "step"), f" {message}"))
+        self._to_file(f"Step {step_num}: {message}")
     
     def capture(self, step_num: int, description: str):
         """Log a screenshot capture."""
-        self.console.print(f"[cyan]📸 Captured[/cyan] Step {step_num}: {description}")
+        self.console.print(_text().assemble(("📸 Captured", "cyan"), f" Step {step_num}: {description}"))
+        self._to_file(f"Captured Step {step_num}: {description}")
     
     def action(self, action_type: str, target: str):
         """Log an inferred action."""
-        self.console.print(f"[magenta]→[/magenta] {action_type}: {target}")
+        self.console.print(_text().assemble(("→", "magenta"), f" {action_type}: {target}"))
+        self._to_file(f"{action_type}: {target}")
+    
+    def _to_file(self, message: str):
+        """Record an already-printed console message as plain text for log files."""
+        if self.logger.isEnabledFor(logging.INFO):
+            if not message.isascii():
+                message = _EMOJI_RE.sub("", message)
+            self.logger.info(message, extra={_CONSOLE_PRINTED: True})
     
     def progress(self, current: int, total: int, message: str = ""):
         """Log progress."""
-        percent = (current / total) * 100 if total > 0 else 0
-        bar_length = 20
-        filled = int(bar_length * current / total) if total > 0 else 0
-        bar = "█" * filled + "░" * (bar_length - filled)
-        self.console.print(f"[cyan]{bar}[/cyan] {percent:.0f}% {message}")
+        if total > 0:
+            percent = round(current * 100 / total)
+            filled = min(max(current * _BAR_LENGTH // total, 0), _BAR_LENGTH)
+        else:
+            percent = filled = 0
+        self.console.print(f"[cyan]{_BARS[filled]}[/cyan] {percent}% {message}")
     
     def section(self, title: str):
         """Print a section header."""
@@ -164,22 +379,11 @@ class ShowOnceLogger:
     
     def key_value(self, key: str, value: str):
         """Print a key-value pair."""
-        self.console.print(f"  [cyan]{key}:[/cyan] {value}")
+        self.console.print(_text().assemble("  ", (f"{key}:", "cyan"), f" {value}"))
     
     def banner(self):
         """Print ShowOnce banner."""
-        banner_text = """
-[bold cyan]
-  ███████╗██╗  ██╗ ██████╗ ██╗    ██╗ ██████╗ ███╗   ██╗ ██████╗███████╗
-  ██╔════╝██║  ██║██╔═══██╗██║    ██║██╔═══██╗████╗  ██║██╔════╝██╔════╝
-  ███████╗███████║██║   ██║██║ █╗ ██║██║   ██║██╔██╗ ██║██║     █████╗  
-  ╚════██║██╔══██║██║   ██║██║███╗██║██║   ██║██║╚██╗██║██║     ██╔══╝  
-  ███████║██║  ██║╚██████╔╝╚███╔███╔╝╚██████╔╝██║ ╚████║╚██████╗███████╗
-  ╚══════╝╚═╝  ╚═╝ ╚═════╝  ╚══╝╚══╝  ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝
-[/bold cyan]
-[dim]Show me once. I'll do it forever.[/dim]
-        """
-        self.console.print(banner_text)
+        self.console.print(_banner())
 
 
 # Default logger instance
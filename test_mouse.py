@@ -1,14 +1,19 @@
+import threading
+
 from pynput import mouse
-import time
+
+clicked = threading.Event()
 
 def on_click(x, y, button, pressed):
     if pressed:
         print(f"Mouse clicked at ({x}, {y}) with {button}")
+        clicked.set()
 
 def test_mouse_listener():
-    print("Starting mouse listener... Click anywhere (Testing for 5 seconds)")
+    print("Starting mouse listener... Click anywhere (Testing for up to 5 seconds)")
+    clicked.clear()
     with mouse.Listener(on_click=on_click) as listener:
-        time.sleep(5)
+        clicked.wait(timeout=5)
         listener.stop()
 
 if __name__ == "__main__":
@@ -0,0 +1,42 @@
+"""
+Shared fixtures for ShowOnce tests.
+"""
+
+import pytest
+
+from showonce.models.workflow import Workflow
+from showonce.models.actions import ElementTarget, SelectorStrategy
+
+
+@pytest.fixture(scope="module")
+def three_step_workflow():
+    """
+    A 3-step workflow built once per module.
+    
+    Shared between tests: treat it as read-only, or copy.deepcopy it first.
+    """
+    workflow = Workflow(name="three_step")
+    workflow.add_step(description="Open page")
+    workflow.add_step(description="Click button")
+    workflow.add_step(description="Submit form")
+    return workflow
+
+
+@pytest.fixture(scope="module")
+def button_target():
+    """A button target with CSS and text selectors, built once per module (read-only)."""
+    target = ElementTarget(description="Submit button")
+    target.add_selector(SelectorStrategy.CSS, "button#submit", confidence=0.95)
+    target.add_selector(SelectorStrategy.TEXT, "Submit", confidence=0.8)
+    return target
+
+
+@pytest.fixture(scope="session")
+def saved_workflow_path(tmp_path_factory):
+    """A 2-step workflow saved to disk once per session, shared by load tests (read-only)."""
+    path = tmp_path_factory.mktemp("wf") / "saved"
+    workflow = Workflow(name="save_test", description="Test save/load")
+    workflow.add_step(description="Step 1")
+    workflow.add_step(description="Step 2")
+    workflow.save(path, save_screenshots=False)
+    return path
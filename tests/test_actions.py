@@ -0,0 +1,165 @@
+"""
+Tests for ShowOnce action models.
+
+Run with: pytest tests/test_actions.py
+"""
+
+import pytest
+
+from showonce.models.actions import (
+    Action, ActionType, ElementTarget, 
+    Selector, SelectorStrategy, ActionSequence
+)
+
+
+class TestElementTarget:
+    """Tests for ElementTarget model."""
+    
+    def test_create_target(self):
+        """Test creating element target."""
+        target = ElementTarget(
+            description="Login button",
+            visual_description="Blue button at bottom"
+        )
+        
+        assert target.description == "Login button"
+        assert len(target.selectors) == 0
+    
+    def test_add_selectors(self):
+        """Test adding selectors to target."""
+        target = ElementTarget(description="Button")
+        
+        target.add_selector(SelectorStrategy.CSS, "button#login", confidence=0.95)
+        target.add_selector(SelectorStrategy.TEXT, "Log In", confidence=0.8)
+        
+        selectors = target.selectors
+        assert len(selectors) == 2
+        
+        primary = target.get_primary_selector()
+        assert primary is not None
+        assert primary.confidence == 0.95
+        assert primary.value == "button#login"
+    
+    def test_primary_selector_tracks_updates(self):
+        """Test primary selector with constructor and later selectors."""
+        target = ElementTarget(
+            description="Button",
+            selectors=[
+                Selector(strategy=SelectorStrategy.TEXT, value="Log In", confidence=0.7),
+                Selector(strategy=SelectorStrategy.CSS, value="#login", confidence=0.9),
+            ]
+        )
+        
+        assert target.get_primary_selector().value == "#login"
+        
+        target.add_selector(SelectorStrategy.XPATH, "//button", confidence=0.9)
+        assert target.get_primary_selector().value == "#login"
+        
+        target.selectors.append(
+            Selector(strategy=SelectorStrategy.ROLE, value="button", confidence=0.99)
+        )
+        assert target.get_primary_selector().value == "button"
+        
+        target.selectors[3] = Selector(strategy=SelectorStrategy.ROLE, value="link", confidence=0.5)
+        assert target.get_primary_selector().value == "#login"
+        
+        target.selectors[0].confidence = 0.95
+        assert target.get_primary_selector().value == "Log In"
+    
+    def test_playwright_selectors(self):
+        """Test converting to Playwright format."""
+        target = ElementTarget(description="Test")
+        target.add_selector(SelectorStrategy.CSS, "div.test")
+        target.add_selector(SelectorStrategy.TEXT, "Click me")
+        
+        selectors = target.get_playwright_selectors()
+        
+        assert "div.test" in selectors
+        assert "text=Click me" in selectors
+
+
+class TestAction:
+    """Tests for Action model."""
+    
+    @pytest.mark.parametrize("action_type,value,variable_name,expected_code,expected_description", [
+        (ActionType.CLICK, None, None, 'await page.click("button#submit")', "Click Submit button"),
+        (ActionType.TYPE, "testuser", "username", 'await page.fill("button#submit", "{username}")',
+         "Type {username} into Submit button"),
+    ])
+    def test_action_codegen(self, button_target, action_type, value, variable_name,
+                            expected_code, expected_description):
+        """Test creating actions and generating their code and descriptions."""
+        action = Action(
+            action_type=action_type,
+            sequence=1,
+            target=button_target,
+            value=value,
+            is_variable=variable_name is not None,
+            variable_name=variable_name,
+            confidence=0.9
+        )
+        
+        assert action.action_type == action_type
+        assert action.value == value
+        assert action.is_variable == (variable_name is not None)
+        assert action.variable_name == variable_name
+        assert action.confidence == 0.9
+        assert expected_code in action.to_playwright_code()
+        assert expected_description in action.to_description()
+
+
+class TestActionSequence:
+    """Tests for ActionSequence model."""
+    
+    def test_create_sequence(self):
+        """Test creating action sequence."""
+        sequence = ActionSequence(workflow_name="test")
+        
+        assert sequence.workflow_name == "test"
+        assert len(sequence.actions) == 0
+    
+    def test_add_actions(self):
+        """Test adding actions to sequence."""
+        sequence = ActionSequence(workflow_name="test")
+        
+        action1 = Action(
+            action_type=ActionType.NAVIGATE,
+            sequence=1,  # Will be updated by add_action
+            url="https://example.com"
+        )
+        
+        action2 = Action(
+            action_type=ActionType.CLICK,
+            sequence=1,  # Will be updated by add_action
+            target=ElementTarget(description="Button")
+        )
+        
+        sequence.add_action(action1)
+        sequence.add_action(action2)
+        
+        assert len(sequence.actions) == 2
+        assert sequence.actions[0].sequence == 1
+        assert sequence.actions[1].sequence == 2
+    
+    def test_parameter_tracking(self):
+        """Test that variables are tracked."""
+        sequence = ActionSequence(workflow_name="test")
+        
+        action = Action(
+            action_type=ActionType.TYPE,
+            sequence=1,  # Will be updated by add_action
+            target=ElementTarget(description="Email field"),
+            value="test@example.com",
+            is_variable=True,
+            variable_name="email"
+        )
+        
+        sequence.add_action(action)
+        
+        assert len(sequence.parameters) == 1
+        assert sequence.parameters[0]["name"] == "email"
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main([__file__, "-q", "--no-header"]))
@@ -29,15 +29,34 @@ from showonce.models.workflow import Workflow, WorkflowStep
 # FIXTURES
 # =============================================================================
 
-@pytest.fixture
-def dummy_image_bytes():
-    """Create dummy image bytes for testing."""
+def _encode_dummy_png() -> bytes:
+    """Encode a small solid-colour PNG."""
     img = Image.new('RGB', (10, 10), color='blue')
     buffer = io.BytesIO()
     img.save(buffer, format='PNG')
     return buffer.getvalue()
 
 
+# Encoded once per module; bytes are immutable, so tests can share them
+_DUMMY_PNG = _encode_dummy_png()
+
+# Tests don't depend on wall-clock time
+_FROZEN_TS = datetime(2024, 1, 1).isoformat()
+
+
+@pytest.fixture
+def dummy_image_bytes():
+    """Create dummy image bytes for testing."""
+    return _DUMMY_PNG
+
+
+@pytest.fixture
+def vision_env():
+    """ClaudeVision wired to a mocked Anthropic client."""
+    with patch('anthropic.Anthropic') as mock_anthropic:
+        yield ClaudeVision(api_key="test-key"), mock_anthropic.return_value
+
+
 @pytest.fixture
 def sample_api_response():
     """Sample Claude API response for transition analysis."""
@@ -77,12 +96,12 @@ def mock_workflow(dummy_image_bytes):
     wf.add_step(
         description="Open login page",
         screenshot_bytes=dummy_image_bytes,
-        timestamp=datetime.now().isoformat()
+        timestamp=_FROZEN_TS
     )
     wf.add_step(
         description="Click login button",
         screenshot_bytes=dummy_image_bytes,
-        timestamp=datetime.now().isoformat()
+        timestamp=_FROZEN_TS
     )
     
     return wf
@@ -171,18 +190,16 @@ class TestPrompts:
 class TestClaudeVision:
     """Tests for vision.py"""
     
-    @patch('anthropic.Anthropic')
-    def test_vision_initialization(self, mock_anthropic):
+    def test_vision_initialization(self, vision_env):
         """Test ClaudeVision initializes correctly."""
-        vision = ClaudeVision(api_key="test-key")
+        vision, mock_client = vision_env
         
         assert vision.api_key == "test-key"
-        mock_anthropic.assert_called_once()
+        assert vision.client is mock_client
     
-    @patch('anthropic.Anthropic')
-    def test_prepare_image_from_bytes(self, mock_anthropic, dummy_image_bytes):
+    def test_prepare_image_from_bytes(self, vision_env, dummy_image_bytes):
         """Test image preparation from bytes."""
-        vision = ClaudeVision(api_key="test-key")
+        vision, _ = vision_env
         result = vision._prepare_image(dummy_image_bytes)
         
         assert "media_type" in result
@@ -192,33 +209,29 @@ class TestClaudeVision:
         decoded = base64.b64decode(result["data"])
         assert len(decoded) > 0
     
-    @patch('anthropic.Anthropic')
-    def test_analyze_image(self, mock_anthropic, dummy_image_bytes):
+    def test_analyze_image(self, vision_env, dummy_image_bytes):
         """Test single image analysis."""
-        mock_client = mock_anthropic.return_value
+        vision, mock_client = vision_env
         mock_response = MagicMock()
         mock_message = MagicMock()
         mock_message.text = "This is a blue square."
         mock_response.content = [mock_message]
         mock_client.messages.create.return_value = mock_response
         
-        vision = ClaudeVision(api_key="test-key")
         result = vision.analyze_image(dummy_image_bytes, "What is this?")
         
         assert result == "This is a blue square."
         mock_client.messages.create.assert_called_once()
     
-    @patch('anthropic.Anthropic')
-    def test_analyze_transition(self, mock_anthropic, dummy_image_bytes, sample_api_response):
+    def test_analyze_transition(self, vision_env, dummy_image_bytes, sample_api_response):
         """Test transition analysis between two images."""
-        mock_client = mock_anthropic.return_value
+        vision, mock_client = vision_env
         mock_response = MagicMock()
         mock_message = MagicMock()
         mock_message.text = json.dumps(sample_api_response)
         mock_response.content = [mock_message]
         mock_client.messages.create.return_value = mock_response
         
-        vision = ClaudeVision(api_key="test-key")
         result = vision.analyze_transition(
             dummy_image_bytes, 
             dummy_image_bytes, 
@@ -229,20 +242,17 @@ class TestClaudeVision:
         assert len(result["actions"]) == 1
         assert result["actions"][0]["type"] == "click"
     
-    @patch('anthropic.Anthropic')
-    def test_api_error_handling(self, mock_anthropic):
+    def test_api_error_handling(self, vision_env):
         """Test API error handling."""
         import anthropic
         
-        mock_client = mock_anthropic.return_value
+        vision, mock_client = vision_env
         mock_client.messages.create.side_effect = anthropic.APIError(
             message="Rate limit exceeded",
             request=MagicMock(),
             body=None
         )
         
-        vision = ClaudeVision(api_key="test-key")
-        
         with pytest.raises(anthropic.APIError):
             vision._call_api([{"role": "user", "content": "test"}])
 
@@ -41,8 +41,7 @@ def test_screen_capture_image_conversions(screen_capture):
     assert len(b64) > 0
     
     # helper validation
-    decoded = base64.b64decode(b64)
-    assert decoded == img_bytes
+    assert b64 == base64.b64encode(img_bytes).decode('ascii')
 
 @patch('mss.mss')
 def test_screen_capture_full_screen(mock_mss_cls, screen_capture):
@@ -0,0 +1,136 @@
+"""
+Tests for ShowOnce logging setup.
+
+Run with: pytest tests/test_logger.py
+"""
+
+import io
+import logging
+import time
+
+import pytest
+from rich.console import Console
+
+from showonce.utils import logger as logger_module
+from showonce.utils.logger import (
+    SHOWONCE_THEME, BufferedFileHandler, ShowOnceLogger, setup_logging, get_logger
+)
+
+
+def _record(message, level=logging.INFO):
+    return logging.LogRecord("showonce.test", level, __file__, 1, message, None, None)
+
+
+@pytest.fixture
+def console_output(monkeypatch):
+    """Send the shared console to a buffer and restore logging afterwards."""
+    buffer = io.StringIO()
+    console = Console(file=buffer, width=200, theme=SHOWONCE_THEME)
+    monkeypatch.setattr(logger_module, "_console", lambda: console)
+    
+    root = logging.getLogger()
+    showonce_logger = logging.getLogger("showonce")
+    saved = root.handlers[:], root.level, showonce_logger.level
+    
+    yield buffer
+    
+    logger_module._stop_listener()
+    root.handlers[:] = saved[0]
+    root.setLevel(saved[1])
+    showonce_logger.setLevel(saved[2])
+
+
+class TestSetupLogging:
+    """Tests for the queued Rich console handler."""
+    
+    def test_exception_with_markup_keeps_listener_alive(self, console_output):
+        """Test a traceback with bracketed text neither breaks nor stops logging."""
+        setup_logging(level="INFO")
+        logger = get_logger("test_logger")
+        
+        try:
+            raise ValueError("bad [/red] value")
+        except ValueError:
+            logger.exception("Step failed")
+        logger.info("done")
+        logger_module._stop_listener()
+        
+        output = console_output.getvalue()
+        assert "Step failed" in output
+        assert "ValueError" in output
+        assert "done" in output
+    
+    def test_show_locals_in_traceback(self, console_output):
+        """Test show_locals adds frame locals to logged tracebacks."""
+        setup_logging(level="INFO", show_locals=True)
+        logger = get_logger("test_logger")
+        
+        def fail():
+            secret_local = "sentinel-value"
+            raise RuntimeError(secret_local)
+        
+        try:
+            fail()
+        except RuntimeError:
+            logger.exception("Run failed")
+        logger_module._stop_listener()
+        
+        # The source line quotes the value with "", the locals panel with ''
+        assert "'sentinel-value'" in console_output.getvalue()
+    
+    def test_console_messages_copied_to_log_file(self, console_output, tmp_path):
+        """Test success() prints once and writes a plain-text copy to the log file."""
+        log_file = tmp_path / "showonce.log"
+        setup_logging(level="INFO", log_file=str(log_file))
+        
+        ShowOnceLogger("test_logger").success("Saved 📸 workflow")
+        logger_module._stop_listener()
+        
+        assert console_output.getvalue().count("Saved") == 1
+        text = log_file.read_text(encoding="utf-8")
+        assert "Saved  workflow" in text
+        assert "📸" not in text
+
+
+class TestBufferedFileHandler:
+    """Tests for BufferedFileHandler."""
+    
+    def test_buffers_until_delay(self, tmp_path):
+        """Test an idle buffer is written out after max_delay without new records."""
+        log_file = tmp_path / "buffered.log"
+        handler = BufferedFileHandler(str(log_file), max_delay=0.05)
+        try:
+            handler.handle(_record("first"))
+            assert log_file.read_text() == ""
+            
+            deadline = time.monotonic() + 5
+            while log_file.read_text() == "" and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert log_file.read_text() == "first\n"
+        finally:
+            handler.close()
+    
+    def test_warning_and_close_flush(self, tmp_path):
+        """Test WARNING records are written at once and close writes the rest."""
+        log_file = tmp_path / "buffered.log"
+        handler = BufferedFileHandler(str(log_file), max_delay=60)
+        
+        handler.handle(_record("note"))
+        handler.handle(_record("careful", logging.WARNING))
+        assert log_file.read_text() == "note\ncareful\n"
+        
+        handler.handle(_record("last"))
+        handler.close()
+        assert log_file.read_text() == "note\ncareful\nlast\n"
+    
+    def test_chunk_size_flush(self, tmp_path):
+        """Test pending records are written once chunk_size bytes accumulate."""
+        log_file = tmp_path / "buffered.log"
+        handler = BufferedFileHandler(str(log_file), chunk_size=10, max_delay=60)
+        try:
+            handler.handle(_record("12345"))
+            assert log_file.read_text() == ""
+            handler.handle(_record("67890"))
+            assert log_file.read_text() == "12345\n67890\n"
+        finally:
+            handler.close()
@@ -0,0 +1,128 @@
+"""
+Tests for ShowOnce script runner.
+
+Run with: pytest tests/test_runner.py
+"""
+
+import os
+import textwrap
+
+import pytest
+
+from showonce.generate.runner import ScriptRunner
+
+
+@pytest.fixture
+def make_script(tmp_path):
+    """Factory writing a small script to a temporary file."""
+    def make(source, name="script.py"):
+        path = tmp_path / name
+        path.write_text(textwrap.dedent(source), encoding="utf-8")
+        return path
+    return make
+
+
+class TestRunInProcess:
+    """Tests for ScriptRunner.run_in_process."""
+    
+    @pytest.mark.parametrize("source,return_code,error", [
+        ("print('hello')", 0, ""),
+        ("import sys\nsys.exit()", 0, ""),
+        ("import sys\nsys.exit(3)", 3, ""),
+        ("import sys\nsys.exit('bad input')", 1, "bad input"),
+        ("raise ValueError('boom')", 1, "ValueError: boom"),
+    ])
+    def test_return_codes(self, make_script, source, return_code, error):
+        """Test exit statuses and uncaught exceptions map to return codes."""
+        result = ScriptRunner(make_script(source)).run_in_process()
+        
+        assert result["return_code"] == return_code
+        assert result["success"] == (return_code == 0)
+        assert error in result["error"]
+    
+    def test_output_captured(self, make_script):
+        """Test the script runs as __main__ with its output captured."""
+        script = make_script("if __name__ == '__main__':\n    print('hello')")
+        
+        result = ScriptRunner(script).run_in_process()
+        
+        assert result["output"] == "hello\n"
+    
+    def test_environment_restored(self, make_script, monkeypatch):
+        """Test params reach the script and environment changes are undone."""
+        monkeypatch.setenv("SHOWONCE_KEEP", "kept")
+        script = make_script("""
+            import os
+            print(os.environ["SHOWONCE_USER"])
+            os.environ["SHOWONCE_LEAK"] = "1"
+            del os.environ["SHOWONCE_KEEP"]
+        """)
+        
+        result = ScriptRunner(script).run_in_process(params={"user": "alice"})
+        
+        assert result["output"] == "alice\n"
+        assert "SHOWONCE_USER" not in os.environ
+        assert "SHOWONCE_LEAK" not in os.environ
+        assert os.environ["SHOWONCE_KEEP"] == "kept"
+
+
+class TestRunMany:
+    """Tests for ScriptRunner.run_many and its persistent worker."""
+    
+    def test_results_in_order(self, make_script):
+        """Test each script's result comes back in order, failures included."""
+        scripts = [
+            make_script("print('first')", "a.py"),
+            make_script("import sys\nsys.exit(2)", "b.py"),
+            make_script("raise RuntimeError('broken')", "c.py"),
+            make_script("print('last')", "d.py"),
+        ]
+        
+        results = ScriptRunner.run_many(scripts)
+        
+        assert [r["return_code"] for r in results] == [0, 2, 1, 0]
+        assert [r["success"] for r in results] == [True, False, False, True]
+        assert results[0]["output"] == "first\n"
+        assert "RuntimeError: broken" in results[2]["error"]
+        assert results[3]["output"] == "last\n"
+    
+    def test_params_env(self, make_script):
+        """Test per-script params are visible only to their own script."""
+        script = make_script("import os\nprint(os.environ.get('SHOWONCE_USER'))")
+        
+        results = ScriptRunner.run_many([script, script], [{"user": "alice"}, None])
+        
+        assert [r["output"] for r in results] == ["alice\n", "None\n"]
+    
+    def test_stdin_isolated(self, make_script):
+        """Test a script reading stdin cannot swallow the following jobs."""
+        reader = make_script("import sys\nprint(repr(sys.stdin.read()))", "reader.py")
+        after = make_script("print('after')", "after.py")
+        
+        results = ScriptRunner.run_many([reader, after])
+        
+        assert results[0]["output"] == "''\n"
+        assert results[1]["output"] == "after\n"
+    
+    # Spawning and killing the worker adds to the batch timeout; leave
+    # headroom over CI's 5s per-test limit on loaded runners
+    @pytest.mark.timeout(30)
+    def test_timeout_keeps_finished_results(self, make_script):
+        """Test a batch timeout fails the unfinished scripts only."""
+        scripts = [
+            make_script("print('done')", "quick.py"),
+            make_script("import time\ntime.sleep(60)", "slow.py"),
+            make_script("print('never')", "skipped.py"),
+        ]
+        
+        results = ScriptRunner.run_many(scripts, timeout=2)
+        
+        assert results[0]["success"] and results[0]["output"] == "done\n"
+        for result in results[1:]:
+            assert result["return_code"] == -1
+            assert "timed out" in result["error"]
+    
+    def test_params_list_length_checked(self, make_script):
+        """Test a mismatched params_list is rejected."""
+        with pytest.raises(ValueError):
+            ScriptRunner.run_many([make_script("pass")], [None, None])
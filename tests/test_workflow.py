@@ -0,0 +1,278 @@
+"""
+Tests for ShowOnce workflow models.
+
+Run with: pytest tests/test_workflow.py
+"""
+
+import pytest
+import base64
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from datetime import datetime
+
+from showonce.models.workflow import Workflow, WorkflowStep, StepMetadata
+
+# Simple 1x1 pixel PNG, decoded once at import
+TINY_PNG_B64 = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
+TINY_PNG_BYTES = base64.b64decode(TINY_PNG_B64)
+
+
+class TestWorkflowStep:
+    """Tests for WorkflowStep model."""
+    
+    def test_create_step(self):
+        """Test creating a basic workflow step."""
+        step = WorkflowStep(
+            step_number=1,
+            description="Click login button"
+        )
+        
+        assert step.step_number == 1
+        assert step.description == "Click login button"
+        assert not step.has_screenshot()
+    
+    def test_step_with_screenshot(self):
+        """Test step with base64 screenshot."""
+        step = WorkflowStep(
+            step_number=1,
+            description="Test step",
+            screenshot_base64=TINY_PNG_B64
+        )
+        
+        assert step.has_screenshot()
+        assert step.load_screenshot_bytes() == TINY_PNG_BYTES
+    
+    def test_step_metadata(self):
+        """Test step with metadata."""
+        step = WorkflowStep(
+            step_number=1,
+            description="Test",
+            metadata=StepMetadata(
+                active_window="Chrome",
+                mouse_position=(100, 200),
+                screen_resolution=(1920, 1080)
+            )
+        )
+        
+        assert step.metadata.active_window == "Chrome"
+        assert step.metadata.mouse_position == (100, 200)
+    
+    def test_screenshot_cache_threads(self):
+        """Test concurrent screenshot loads while the shared cache evicts entries."""
+        steps = [
+            WorkflowStep(step_number=i, description="Step", screenshot_base64=TINY_PNG_B64)
+            for i in range(1, 101)
+        ]
+        
+        def load_all(_):
+            return all(step.load_screenshot_bytes() == TINY_PNG_BYTES for step in steps * 5)
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(pool.map(load_all, range(8)))
+
+
+class TestWorkflow:
+    """Tests for Workflow model."""
+    
+    def test_create_workflow(self):
+        """Test creating a basic workflow."""
+        workflow = Workflow(
+            name="test_workflow",
+            description="A test workflow"
+        )
+        
+        assert workflow.name == "test_workflow"
+        assert workflow.description == "A test workflow"
+        assert workflow.step_count == 0
+    
+    def test_add_steps(self, three_step_workflow):
+        """Test adding steps to workflow."""
+        workflow = three_step_workflow
+        
+        step_count, transition_count = workflow.step_count, workflow.transition_count
+        assert step_count == 3
+        assert transition_count == 2
+        
+        step = workflow.get_step(2)
+        assert step is not None
+        assert step.description == "Click button"
+    
+    def test_remove_step(self, three_step_workflow):
+        """Test removing a step."""
+        workflow = copy.deepcopy(three_step_workflow)
+        
+        workflow.remove_step(2)
+        
+        assert workflow.step_count == 2
+        assert workflow.steps[1].step_number == 2
+        assert workflow.steps[1].description == "Submit form"
+        assert three_step_workflow.step_count == 3
+    
+    def test_remove_steps(self):
+        """Test removing several steps at once."""
+        workflow = Workflow(name="test")
+        for i in range(1, 6):
+            workflow.add_step(description=f"Step {i}")
+        
+        assert workflow.remove_steps([4, 2, 9]) == 2
+        
+        assert [s.description for s in workflow.steps] == ["Step 1", "Step 3", "Step 5"]
+        assert [s.step_number for s in workflow.steps] == [1, 2, 3]
+    
+    def test_add_steps_batch(self):
+        """Test adding a batch of steps."""
+        workflow = Workflow(name="test")
+        workflow.add_step(description="Step 1")
+        stamp = datetime(2024, 1, 1, 12, 0, 0)
+        
+        steps = workflow.add_steps(
+            [{"description": "Step 2"}, {"description": "Step 3", "window_title": "Editor"}],
+            timestamp=stamp
+        )
+        
+        assert [s.step_number for s in steps] == [2, 3]
+        assert workflow.step_count == 3
+        assert all(s.timestamp == stamp for s in steps)
+        assert steps[1].metadata.window_title == "Editor"
+    
+    def test_add_step_validates_metadata(self, tmp_path):
+        """Test caller-supplied metadata is parsed, so the workflow still saves."""
+        workflow = Workflow(name="test")
+        step = workflow.add_step(
+            description="Step 1",
+            timestamp="2024-01-01T00:00:00",
+            mouse_position=[10, 20]
+        )
+        
+        assert step.timestamp == datetime(2024, 1, 1)
+        assert step.metadata.mouse_position == (10, 20)
+        
+        workflow.save(tmp_path, save_screenshots=False)
+        loaded = Workflow.load(tmp_path)
+        assert loaded.steps[0].timestamp == datetime(2024, 1, 1)
+    
+    def test_dedupe_file_backed_screenshot(self, tmp_path, monkeypatch):
+        """Test a new frame shares the previous file only if the bytes match."""
+        workflow = Workflow(name="test")
+        workflow.add_step(description="Step 1", screenshot_bytes=TINY_PNG_BYTES)
+        workflow.save(tmp_path)
+        previous_path = workflow.steps[0].screenshot_path
+        
+        same = workflow.add_step(description="Step 2", screenshot_bytes=TINY_PNG_BYTES)
+        assert same.screenshot_path == previous_path
+        assert same.screenshot_bytes is None
+        
+        # Force a digest collision: differing bytes must stay with the step
+        monkeypatch.setattr("showonce.models.workflow._hash_screenshot", lambda data: b"\0" * 8)
+        workflow.add_step(description="Step 3", screenshot_bytes=TINY_PNG_BYTES)
+        workflow.save(tmp_path)
+        collided = workflow.add_step(description="Step 4", screenshot_bytes=b"other image")
+        assert collided.screenshot_path is None
+        assert collided.screenshot_bytes == b"other image"
+    
+    def test_save_and_load(self, saved_workflow_path):
+        """Test loading a saved workflow."""
+        # Verify files exist
+        assert (saved_workflow_path / "workflow.json").exists()
+        
+        # Load and verify
+        loaded = Workflow.load(saved_workflow_path)
+        assert loaded.name == "save_test"
+        assert loaded.step_count == 2
+        assert loaded.steps[0].description == "Step 1"
+    
+    def test_save_screenshot_bytes(self, tmp_path):
+        """Test raw screenshot bytes are written to disk or embedded."""
+        image_bytes = b"\x89PNG\r\n\x1a\nfake image data"
+        
+        workflow = Workflow(name="bytes_test")
+        step = workflow.add_step(description="Step 1", screenshot_bytes=image_bytes)
+        assert step.screenshot_base64 is None
+        assert step.load_screenshot_bytes() == image_bytes
+        
+        workflow.save(tmp_path / "files")
+        assert Path(step.screenshot_path).read_bytes() == image_bytes
+        assert step.screenshot_bytes is None
+        
+        workflow = Workflow(name="bytes_test")
+        workflow.add_step(description="Step 1", screenshot_bytes=image_bytes)
+        workflow.save(tmp_path / "embedded", save_screenshots=False)
+        loaded = Workflow.load(tmp_path / "embedded")
+        assert loaded.steps[0].load_screenshot_bytes() == image_bytes
+    
+    def test_add_step_screenshot_path(self, tmp_path):
+        """Test steps can reference a screenshot already on disk."""
+        image_path = tmp_path / "upload.webp"
+        image_path.write_bytes(b"uploaded image")
+        
+        workflow = Workflow(name="path_test")
+        step = workflow.add_step(description="Upload", screenshot_path=image_path)
+        assert step.screenshot_path == str(image_path)
+        assert step.screenshot_bytes is None
+        
+        workflow.save(tmp_path / "wf")
+        loaded = Workflow.load(tmp_path / "wf")
+        assert loaded.steps[0].load_screenshot_bytes() == b"uploaded image"
+    
+    def test_save_packed_screenshots(self, tmp_path):
+        """Test packing screenshots into a single blob file."""
+        images = [b"first image", b"second, longer image"]
+        workflow = Workflow(name="packed_test")
+        for i, image in enumerate(images):
+            workflow.add_step(description=f"Step {i + 1}", screenshot_bytes=image)
+        
+        save_path = tmp_path / "packed"
+        workflow.save(save_path, pack_screenshots=True)
+        assert (save_path / "screenshots.blob").exists()
+        
+        # Re-packing rewrites the blob the steps currently point at
+        workflow.save(save_path, pack_screenshots=True)
+        
+        loaded = Workflow.load(save_path)
+        assert [s.load_screenshot_bytes() for s in loaded.steps] == images
+        assert loaded.steps[1].screenshot_blob == (len(images[0]), len(images[1]))
+    
+    def test_repeated_screenshots_shared(self, tmp_path):
+        """Test identical consecutive screenshots are stored once."""
+        workflow = Workflow(name="dedupe_test")
+        first = workflow.add_step(description="Step 1", screenshot_bytes=b"same frame")
+        second = workflow.add_step(description="Step 2", screenshot_bytes=bytes(b"same frame"))
+        third = workflow.add_step(description="Step 3", screenshot_bytes=b"new frame")
+        
+        assert second.screenshot_bytes is first.screenshot_bytes
+        
+        workflow.save(tmp_path / "dedupe")
+        
+        assert second.screenshot_path == first.screenshot_path
+        assert third.screenshot_path != first.screenshot_path
+        assert len(list((tmp_path / "dedupe" / "screenshots").iterdir())) == 2
+        assert second.load_screenshot_bytes() == b"same frame"
+        
+        # A repeat of a frame already on disk points at the same file
+        fourth = workflow.add_step(description="Step 4", screenshot_bytes=b"new frame")
+        assert fourth.screenshot_bytes is None
+        assert fourth.screenshot_path == third.screenshot_path
+    
+    def test_get_screenshot_pairs(self, three_step_workflow):
+        """Test getting consecutive step pairs."""
+        pairs = list(three_step_workflow.get_screenshot_pairs())
+        
+        assert len(pairs) == 2
+        assert pairs[0][0].description == "Open page"
+        assert pairs[0][1].description == "Click button"
+        assert pairs[1][0].description == "Click button"
+        assert pairs[1][1].description == "Submit form"
+    
+    def test_workflow_summary(self, three_step_workflow):
+        """Test workflow summary output."""
+        summary = three_step_workflow.summary()
+        
+        assert "three_step" in summary
+        assert "Open page" in summary
+        assert "Click button" in summary
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main([__file__, "-q", "--no-header"]))